@@ -1,16 +1,24 @@
 from .state import AnalystState, MarketData
+from .base_analyst import BaseAnalyst
 from .news_analyst import NewsAnalyst
 from .fundamentals_analyst import FundamentalsAnalyst
 from .sentiment_analyst import SentimentAnalyst
 from .technical_analyst import TechnicalAnalyst
+from .batched_analyst import CompositeAnalyst
 from .team import AnalystsTeam
+from .cache import LLMCache
+from .llm import get_default_llm
 
 __all__ = [
     "AnalystState",
     "MarketData",
+    "BaseAnalyst",
     "NewsAnalyst",
     "FundamentalsAnalyst",
     "SentimentAnalyst",
     "TechnicalAnalyst",
+    "CompositeAnalyst",
     "AnalystsTeam",
+    "LLMCache",
+    "get_default_llm",
 ]
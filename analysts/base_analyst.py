@@ -0,0 +1,114 @@
+"""Base class for the single-role analyst agents.
+
+Holds the LLM flow every analyst shares: prompt/chain setup, optional
+response caching, strict async parsing and the neutral fallback report.
+Subclasses only supply their prompts, their prompt inputs and their role.
+"""
+
+from typing import Optional
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_groq import ChatGroq
+
+from .state import AnalystState, AnalystReportModel
+from .llm import get_default_llm, astream_json
+from .cache import LLMCache
+from .fast_parser import OrjsonOutputParser
+
+
+class BaseAnalyst:
+    """Shared analyze/parse/fallback flow for one analyst role."""
+
+    # Role name: used for the "<role>_analysis" state key, the report's
+    # analyst_type and the response cache namespace
+    ANALYST_TYPE: str = ""
+    SYSTEM_PROMPT: str = ""
+    USER_PROMPT: str = ""
+    TEMPERATURE: float = 0.1
+    # Reasoning reported when _prepare_inputs() finds nothing to analyze
+    MISSING_DATA_REASONING: str = "No data available for analysis."
+
+    def __init__(self, llm: Optional[ChatGroq] = None, cache: Optional[LLMCache] = None):
+        self.llm = llm or get_default_llm(temperature=self.TEMPERATURE)
+        self.prompt = ChatPromptTemplate.from_messages([
+            ("system", self.SYSTEM_PROMPT),
+            ("user", self.USER_PROMPT),
+        ])
+        self.parser = OrjsonOutputParser(pydantic_object=AnalystReportModel)
+        self.chain = self.prompt | self.llm | self.parser
+        self.cache = cache
+
+    def analyze(self, state: AnalystState) -> dict:
+        """Run the analysis and return this analyst's state update."""
+        inputs = self._prepare_inputs(state)
+        if inputs is None:
+            return self._fallback_report(self.MISSING_DATA_REASONING)
+
+        try:
+            result = self._invoke(inputs)
+            return self._build_report(result)
+        except Exception as e:
+            return self._fallback_report(f"Analysis failed: {str(e)}")
+
+    async def analyze_async(self, state: AnalystState) -> dict:
+        """Async variant of analyze() for concurrent LLM calls."""
+        inputs = self._prepare_inputs(state)
+        if inputs is None:
+            return self._fallback_report(self.MISSING_DATA_REASONING)
+
+        try:
+            result = await self._ainvoke(inputs)
+            return self._build_report(result)
+        except Exception as e:
+            return self._fallback_report(f"Analysis failed: {str(e)}")
+
+    def _invoke(self, inputs: dict) -> dict:
+        """Run the chain, serving repeats from the response cache if set."""
+        if self.cache is None:
+            return self.chain.invoke(inputs)
+        return self.cache.get_or_compute(
+            self.prompt.format(**inputs),
+            lambda: self.chain.invoke(inputs),
+            namespace=f"{self.ANALYST_TYPE}:{inputs['ticker']}",
+        )
+
+    async def _ainvoke(self, inputs: dict) -> dict:
+        """Async variant of _invoke() that streams the response and parses it strictly."""
+        if self.cache is None:
+            return await astream_json(self.chain, inputs)
+        return await self.cache.aget_or_compute(
+            self.prompt.format(**inputs),
+            lambda: astream_json(self.chain, inputs),
+            namespace=f"{self.ANALYST_TYPE}:{inputs['ticker']}",
+        )
+
+    def _prepare_inputs(self, state: AnalystState) -> Optional[dict]:
+        """Build the prompt inputs, or None if there is nothing to analyze."""
+        raise NotImplementedError
+
+    def _build_report(self, result: dict) -> dict:
+        """Convert the parsed LLM output into a state update."""
+        return {
+            f"{self.ANALYST_TYPE}_analysis": {
+                "analyst_type": self.ANALYST_TYPE,
+                "signal": result.get("signal", "HOLD"),
+                "confidence": float(result.get("confidence", 0.5)),
+                "reasoning": result.get("reasoning", ""),
+                "key_factors": result.get("key_factors", []),
+            }
+        }
+
+    def _fallback_report(self, reasoning: str) -> dict:
+        """Neutral HOLD report used when analysis cannot run."""
+        return {
+            f"{self.ANALYST_TYPE}_analysis": {
+                "analyst_type": self.ANALYST_TYPE,
+                "signal": "HOLD",
+                "confidence": 0.0,
+                "reasoning": reasoning,
+                "key_factors": [],
+            }
+        }
+
+    def __call__(self, state: AnalystState) -> dict:
+        """Make the analyst callable for LangGraph nodes."""
+        return self.analyze(state)
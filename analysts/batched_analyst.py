@@ -0,0 +1,169 @@
+"""Composite (batched) Analyst Agent.
+
+Produces the news, fundamentals, sentiment and technical reports in a single
+LLM request instead of four separate round-trips. Context blocks are built
+with the individual analysts' own formatting helpers so each sub-report sees
+the same inputs it would in the per-analyst graph.
+"""
+
+from typing import Optional
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_groq import ChatGroq
+
+from .state import AnalystState
+from .llm import get_default_llm, astream_json
+from .fast_parser import OrjsonOutputParser
+from .news_analyst import NewsAnalyst
+from .fundamentals_analyst import FundamentalsAnalyst
+from .sentiment_analyst import SentimentAnalyst
+from .technical_analyst import TechnicalAnalyst
+
+
+# Static persona/task/schema block. Kept free of template variables and
+# sent first so provider-side prompt caching can reuse it across calls.
+COMPOSITE_SYSTEM_PROMPT = """You are an analyst team of four specialists working on the same stock:
+
+1. NEWS ANALYST - judges the impact of news articles on the stock price
+   (relevance, short vs long-term implications, sentiment shift, sector trends).
+2. FUNDAMENTALS ANALYST - evaluates financial health (growth, profitability,
+   balance sheet, cash flow, valuation, competitive moat).
+3. SENTIMENT ANALYST - assesses investor psychology from headlines and price
+   action (media tone, fear/greed, sector rotation, contrarian signals).
+4. TECHNICAL ANALYST - reads price action and indicators (trend, support and
+   resistance, momentum, volume confirmation, patterns).
+
+Each specialist must reason independently using only the data relevant to
+their role. If a specialist's data is marked unavailable, return HOLD with
+confidence 0.0 for that specialist.
+
+Respond in JSON format, with one report per specialist:
+{{
+    "news": {{
+        "signal": "BUY" | "SELL" | "HOLD",
+        "confidence": <float 0.0-1.0>,
+        "reasoning": "<detailed analysis>",
+        "key_factors": ["<factor1>", "<factor2>", ...]
+    }},
+    "fundamentals": {{ ...same fields... }},
+    "sentiment": {{ ...same fields... }},
+    "technical": {{ ...same fields... }}
+}}
+"""
+
+COMPOSITE_PROMPT = """TICKER: {ticker}
+CURRENT PRICE: ${current_price}
+
+=== NEWS ANALYST DATA ===
+NEWS ARTICLES:
+{news_articles}
+
+=== FUNDAMENTALS ANALYST DATA ===
+FINANCIAL DATA:
+{financial_data}
+
+=== SENTIMENT ANALYST DATA ===
+NEWS HEADLINES:
+{news_headlines}
+Recent Price Change: {price_change}%
+
+=== TECHNICAL ANALYST DATA ===
+Price History (recent): {price_history}
+Volume History (recent): {volume_history}
+CALCULATED INDICATORS:
+{indicators}
+"""
+
+
+class CompositeAnalyst:
+    """Runs all four analyst roles in one batched LLM call."""
+
+    # Reasoning used for roles whose input data is missing entirely
+    MISSING_DATA_REASONING = {
+        "news": "No news articles available for analysis.",
+        "fundamentals": "No financial data available for analysis.",
+    }
+
+    def __init__(self, llm: Optional[ChatGroq] = None):
+        self.llm = llm or get_default_llm()
+        self.prompt = ChatPromptTemplate.from_messages([
+            ("system", COMPOSITE_SYSTEM_PROMPT),
+            ("user", COMPOSITE_PROMPT),
+        ])
+        self.parser = OrjsonOutputParser()
+        self.chain = self.prompt | self.llm | self.parser
+
+        # Individual analysts are only used for their input formatting and
+        # report-shaping helpers; their own chains are never invoked here.
+        self.analysts = {
+            "news": NewsAnalyst(llm=self.llm),
+            "fundamentals": FundamentalsAnalyst(llm=self.llm),
+            "sentiment": SentimentAnalyst(llm=self.llm),
+            "technical": TechnicalAnalyst(llm=self.llm),
+        }
+
+    def analyze(self, state: AnalystState) -> dict:
+        """Analyze with all four roles and return every *_analysis key."""
+        sub_inputs, inputs = self._prepare_inputs(state)
+
+        try:
+            result = self.chain.invoke(inputs)
+            return self._build_reports(result, sub_inputs)
+        except Exception as e:
+            return self._fallback_reports(f"Analysis failed: {str(e)}")
+
+    async def analyze_async(self, state: AnalystState) -> dict:
+        """Async variant of analyze() that streams the response and parses it strictly."""
+        sub_inputs, inputs = self._prepare_inputs(state)
+
+        try:
+            # The four reports make for a long response, the most likely to
+            # be cut off; a truncated one falls back instead of half-parsing
+            result = await astream_json(self.chain, inputs)
+            return self._build_reports(result, sub_inputs)
+        except Exception as e:
+            return self._fallback_reports(f"Analysis failed: {str(e)}")
+
+    def _prepare_inputs(self, state: AnalystState) -> tuple:
+        """Build each role's inputs and merge them into one prompt payload."""
+        sub_inputs = {
+            name: analyst._prepare_inputs(state)
+            for name, analyst in self.analysts.items()
+        }
+        news = sub_inputs["news"] or {}
+        fundamentals = sub_inputs["fundamentals"] or {}
+        sentiment = sub_inputs["sentiment"]
+        technical = sub_inputs["technical"]
+
+        inputs = {
+            "ticker": state.ticker,
+            "current_price": (state.market_data or {}).get("current_price", "N/A"),
+            "news_articles": news.get("news_articles", "UNAVAILABLE"),
+            "financial_data": fundamentals.get("financial_data", "UNAVAILABLE"),
+            "news_headlines": sentiment["news_headlines"],
+            "price_change": sentiment["price_change"],
+            "price_history": technical["price_history"],
+            "volume_history": technical["volume_history"],
+            "indicators": technical["indicators"],
+        }
+        return sub_inputs, inputs
+
+    def _build_reports(self, result: dict, sub_inputs: dict) -> dict:
+        """Split the batched response into the four per-analyst state keys."""
+        update = {}
+        for name, analyst in self.analysts.items():
+            if sub_inputs[name] is None:
+                update.update(analyst._fallback_report(self.MISSING_DATA_REASONING[name]))
+            else:
+                update.update(analyst._build_report(result.get(name) or {}))
+        return update
+
+    def _fallback_reports(self, reasoning: str) -> dict:
+        """Neutral HOLD reports for every role."""
+        update = {}
+        for analyst in self.analysts.values():
+            update.update(analyst._fallback_report(reasoning))
+        return update
+
+    def __call__(self, state: AnalystState) -> dict:
+        """Make the analyst callable for LangGraph nodes."""
+        return self.analyze(state)
@@ -0,0 +1,193 @@
+"""Response cache for analyst LLM calls.
+
+Analysts frequently rebuild the same prompt for the same ticker and market
+snapshot (backtests, parameter sweeps, repeated reporting). LLMCache stores
+the parsed JSON result of each call and serves repeats without hitting the
+LLM. Lookups try an exact sha256 match on the rendered prompt first and,
+when an embeddings model is supplied, fall back to cosine similarity
+against previously seen prompts.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    from langchain_community.embeddings import HuggingFaceEmbeddings
+except ImportError:
+    HuggingFaceEmbeddings = None
+
+
+DEFAULT_EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+
+
+class LLMCache:
+    """Exact + semantic cache of parsed LLM responses with TTL expiry."""
+
+    def __init__(
+        self,
+        embeddings: Optional[Any] = None,
+        similarity_threshold: float = 0.92,
+        ttl_seconds: float = 3600.0,
+        max_entries: int = 1024,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            embeddings: Optional LangChain embeddings model (anything with
+                ``embed_query``). Without it only exact matches are served.
+            similarity_threshold: Minimum cosine similarity for a semantic hit
+            ttl_seconds: Entry lifetime in seconds
+            max_entries: Maximum number of cached responses
+        """
+        self.embeddings = embeddings
+        self.similarity_threshold = similarity_threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+        # sha256 key -> (namespace, timestamp, result)
+        self._exact: "OrderedDict[str, Tuple[str, float, dict]]" = OrderedDict()
+        # namespace -> parallel lists of unit vectors and sha256 keys
+        self._vectors: Dict[str, List[np.ndarray]] = {}
+        self._vector_keys: Dict[str, List[str]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def with_default_embeddings(cls, **kwargs) -> "LLMCache":
+        """Build a semantic cache using a local sentence-transformers model."""
+        if HuggingFaceEmbeddings is None:
+            raise ImportError(
+                "langchain-community is required for semantic caching. "
+                "Install with: pip install langchain-community sentence-transformers"
+            )
+        return cls(embeddings=HuggingFaceEmbeddings(model_name=DEFAULT_EMBEDDING_MODEL), **kwargs)
+
+    def get_or_compute(
+        self,
+        prompt_text: str,
+        compute: Callable[[], dict],
+        namespace: str = "",
+    ) -> dict:
+        """Return a cached result for the prompt, or compute and store it."""
+        key = self._key(prompt_text, namespace)
+        vector = None
+
+        cached = self._lookup_exact(key)
+        if cached is not None:
+            return cached
+
+        if self.embeddings is not None:
+            vector = self._embed(self.embeddings.embed_query(prompt_text))
+            cached = self._lookup_similar(vector, namespace)
+            if cached is not None:
+                return cached
+
+        result = compute()
+        self._store(key, namespace, result, vector)
+        return result
+
+    async def aget_or_compute(
+        self,
+        prompt_text: str,
+        compute: Callable[[], Awaitable[dict]],
+        namespace: str = "",
+    ) -> dict:
+        """Async variant of get_or_compute()."""
+        key = self._key(prompt_text, namespace)
+        vector = None
+
+        cached = self._lookup_exact(key)
+        if cached is not None:
+            return cached
+
+        if self.embeddings is not None:
+            vector = self._embed(await self.embeddings.aembed_query(prompt_text))
+            cached = self._lookup_similar(vector, namespace)
+            if cached is not None:
+                return cached
+
+        result = await compute()
+        self._store(key, namespace, result, vector)
+        return result
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self._exact.clear()
+            self._vectors.clear()
+            self._vector_keys.clear()
+
+    def __len__(self) -> int:
+        return len(self._exact)
+
+    # ========== Internals ==========
+
+    @staticmethod
+    def _key(prompt_text: str, namespace: str) -> str:
+        return hashlib.sha256(f"{namespace}\x00{prompt_text}".encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _embed(values: List[float]) -> np.ndarray:
+        vector = np.asarray(values, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _is_fresh(self, timestamp: float) -> bool:
+        return (time.time() - timestamp) < self.ttl_seconds
+
+    def _lookup_exact(self, key: str) -> Optional[dict]:
+        with self._lock:
+            entry = self._exact.get(key)
+            if entry is None:
+                return None
+            if not self._is_fresh(entry[1]):
+                self._evict(key)
+                return None
+            self._exact.move_to_end(key)
+            return entry[2]
+
+    def _lookup_similar(self, vector: np.ndarray, namespace: str) -> Optional[dict]:
+        with self._lock:
+            vectors = self._vectors.get(namespace)
+            if not vectors:
+                return None
+
+            similarities = np.vstack(vectors) @ vector
+            best = int(np.argmax(similarities))
+            if similarities[best] < self.similarity_threshold:
+                return None
+
+            key = self._vector_keys[namespace][best]
+            entry = self._exact.get(key)
+            if entry is None or not self._is_fresh(entry[1]):
+                self._evict(key)
+                return None
+            return entry[2]
+
+    def _store(self, key: str, namespace: str, result: dict, vector: Optional[np.ndarray]) -> None:
+        with self._lock:
+            if key in self._exact:
+                self._evict(key)
+            self._exact[key] = (namespace, time.time(), result)
+            if vector is not None:
+                self._vectors.setdefault(namespace, []).append(vector)
+                self._vector_keys.setdefault(namespace, []).append(key)
+
+            while len(self._exact) > self.max_entries:
+                self._evict(next(iter(self._exact)))
+
+    def _evict(self, key: str) -> None:
+        """Remove an entry and its vector. Caller must hold the lock."""
+        entry = self._exact.pop(key, None)
+        if entry is None:
+            return
+        keys = self._vector_keys.get(entry[0])
+        if keys and key in keys:
+            index = keys.index(key)
+            del keys[index]
+            del self._vectors[entry[0]][index]
@@ -0,0 +1,60 @@
+"""orjson-backed JSON output parser for analyst LLM responses.
+
+LangChain's JsonOutputParser decodes with the stdlib json module. When the
+four analysts return at once, their parsing runs back to back on the event
+loop, so a faster decoder trims the tail of every analysis. OrjsonOutputParser
+keeps JsonOutputParser's streaming (partial) parsing and format instructions
+and only swaps the decoder used for complete responses.
+"""
+
+import json
+import re
+from typing import Any, List
+
+from langchain_core.exceptions import OutputParserException
+from langchain_core.outputs import Generation
+from langchain_core.output_parsers import JsonOutputParser
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Matches a ```json ... ``` (or bare ```) fenced block around the payload
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.DOTALL)
+
+
+def _extract_json(text: str) -> str:
+    """Strip surrounding markdown fences from an LLM response."""
+    match = _FENCE_RE.search(text)
+    return match.group(1) if match else text.strip()
+
+
+def parse_json_strict(text: str) -> Any:
+    """
+    Decode a complete LLM response, rejecting truncated or malformed JSON.
+
+    Unlike JsonOutputParser, which repairs a cut-off object into a partial
+    one, this raises OutputParserException so callers can fall back.
+    """
+    payload = _extract_json(text)
+    try:
+        return orjson.loads(payload) if orjson is not None else json.loads(payload)
+    except ValueError as e:  # orjson.JSONDecodeError subclasses ValueError
+        raise OutputParserException(f"Invalid JSON in LLM response: {e}", llm_output=text) from e
+
+
+class OrjsonOutputParser(JsonOutputParser):
+    """JsonOutputParser that decodes complete responses with orjson."""
+
+    def parse_result(self, result: List[Generation], *, partial: bool = False) -> Any:
+        if partial or orjson is None:
+            return super().parse_result(result, partial=partial)
+
+        try:
+            return orjson.loads(_extract_json(result[0].text))
+        except orjson.JSONDecodeError:
+            # Defer to LangChain's parser so lenient cases and error
+            # messages behave exactly like JsonOutputParser.
+            return super().parse_result(result, partial=partial)
@@ -4,22 +4,18 @@ Analyzes financial reports, earnings, balance sheets, and company fundamentals
 to assess intrinsic value and long-term investment potential.
 """
 
+import json
 from typing import Optional
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import JsonOutputParser
-from langchain_groq import ChatGroq
 
-from .state import AnalystState, AnalystReport
+from .base_analyst import BaseAnalyst
+from .state import AnalystState
 
 
-FUNDAMENTALS_PROMPT = """You are a senior fundamental analyst with expertise in financial statement analysis.
+# Static persona/task/schema block. Kept free of template variables and
+# sent first so provider-side prompt caching can reuse it across calls.
+FUNDAMENTALS_SYSTEM_PROMPT = """You are a senior fundamental analyst with expertise in financial statement analysis.
 
-TASK: Analyze the financial data for {ticker} and assess investment potential.
-
-FINANCIAL DATA:
-{financial_data}
-
-CURRENT PRICE: ${current_price}
+TASK: Analyze the financial data provided by the user and assess investment potential.
 
 Evaluate the following:
 1. Revenue growth and profitability trends
@@ -37,74 +33,37 @@ Respond in JSON format:
 }}
 """
 
+FUNDAMENTALS_PROMPT = """TICKER: {ticker}
 
-class FundamentalsAnalyst:
+FINANCIAL DATA:
+{financial_data}
+
+CURRENT PRICE: ${current_price}
+"""
+
+
+class FundamentalsAnalyst(BaseAnalyst):
     """Fundamentals analyst that evaluates company financial health."""
 
-    def __init__(self, llm: Optional[ChatGroq] = None):
-        self.llm = llm or ChatGroq(model="llama-3.3-70b-versatile", temperature=0.1)
-        self.prompt = ChatPromptTemplate.from_template(FUNDAMENTALS_PROMPT)
-        self.parser = JsonOutputParser()
+    ANALYST_TYPE = "fundamentals"
+    SYSTEM_PROMPT = FUNDAMENTALS_SYSTEM_PROMPT
+    USER_PROMPT = FUNDAMENTALS_PROMPT
+    MISSING_DATA_REASONING = "No financial data available for analysis."
 
-    def analyze(self, state: AnalystState) -> dict:
-        """Analyze fundamentals and return updated state."""
-        market_data = state.get("market_data", {})
+    def _prepare_inputs(self, state: AnalystState) -> Optional[dict]:
+        """Build the prompt inputs, or None if there are no financials."""
+        market_data = state.market_data or {}
         financial_reports = market_data.get("financial_reports", {})
 
         if not financial_reports:
-            return {
-                "fundamentals_analysis": {
-                    "analyst_type": "fundamentals",
-                    "signal": "HOLD",
-                    "confidence": 0.0,
-                    "reasoning": "No financial data available for analysis.",
-                    "key_factors": [],
-                }
-            }
-
-        financial_text = self._format_financial_data(financial_reports)
-
-        chain = self.prompt | self.llm | self.parser
-
-        try:
-            result = chain.invoke({
-                "ticker": state["ticker"],
-                "financial_data": financial_text,
-                "current_price": market_data.get("current_price", "N/A"),
-            })
-
-            return {
-                "fundamentals_analysis": {
-                    "analyst_type": "fundamentals",
-                    "signal": result.get("signal", "HOLD"),
-                    "confidence": float(result.get("confidence", 0.5)),
-                    "reasoning": result.get("reasoning", ""),
-                    "key_factors": result.get("key_factors", []),
-                }
-            }
-        except Exception as e:
-            return {
-                "fundamentals_analysis": {
-                    "analyst_type": "fundamentals",
-                    "signal": "HOLD",
-                    "confidence": 0.0,
-                    "reasoning": f"Analysis failed: {str(e)}",
-                    "key_factors": [],
-                }
-            }
+            return None
+
+        return {
+            "ticker": state.ticker,
+            "financial_data": self._format_financial_data(financial_reports),
+            "current_price": market_data.get("current_price", "N/A"),
+        }
 
     def _format_financial_data(self, data: dict) -> str:
-        """Format financial data dictionary into readable text."""
-        lines = []
-        for category, values in data.items():
-            lines.append(f"\n{category.upper()}:")
-            if isinstance(values, dict):
-                for key, val in values.items():
-                    lines.append(f"  - {key}: {val}")
-            else:
-                lines.append(f"  {values}")
-        return "\n".join(lines)
-
-    def __call__(self, state: AnalystState) -> dict:
-        """Make the analyst callable for LangGraph nodes."""
-        return self.analyze(state)
+        """Serialize financial data as compact JSON for the prompt."""
+        return json.dumps(data, separators=(",", ":"), default=str)
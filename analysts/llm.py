@@ -0,0 +1,120 @@
+"""Shared LLM client factory for the Analysts Team.
+
+Every analyst used to construct its own ChatGroq when no ``llm`` was passed,
+which meant one HTTP connection pool (and one TLS handshake) per analyst.
+get_default_llm() hands out a single ChatGroq per temperature, all backed by
+the same pooled httpx clients, so concurrent analyst calls reuse connections.
+Async connections are pooled per event loop, because each asyncio.run()
+starts a new loop and connections opened on a closed loop can't be reused.
+"""
+
+import asyncio
+import threading
+from functools import lru_cache
+from typing import Dict, Tuple
+
+import httpx
+from langchain_core.exceptions import OutputParserException
+from langchain_core.runnables import RunnableSequence
+from langchain_groq import ChatGroq
+
+from .fast_parser import parse_json_strict
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 multiplexing in httpx)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+DEFAULT_MODEL = "llama-3.3-70b-versatile"
+
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=40)
+
+
+class LoopLocalTransport(httpx.AsyncBaseTransport):
+    """
+    Async transport that keeps a separate connection pool per event loop.
+
+    Pooled keep-alive connections belong to the loop that opened them, so
+    one pool shared by successive asyncio.run() calls fails once the first
+    loop is closed. Each running loop gets its own AsyncHTTPTransport here;
+    pools of closed loops are discarded when the next loop's pool is made.
+    """
+
+    def __init__(self, **transport_kwargs):
+        self._transport_kwargs = transport_kwargs
+        # Pooled connections reference their loop, so a weak-keyed map would
+        # never release entries; closed loops are pruned explicitly instead
+        self._transports: Dict[asyncio.AbstractEventLoop, httpx.AsyncHTTPTransport] = {}
+        self._lock = threading.Lock()
+
+    def _current(self) -> httpx.AsyncHTTPTransport:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            transport = self._transports.get(loop)
+            if transport is None:
+                for closed in [l for l in self._transports if l.is_closed()]:
+                    del self._transports[closed]
+                transport = httpx.AsyncHTTPTransport(**self._transport_kwargs)
+                self._transports[loop] = transport
+        return transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._current().handle_async_request(request)
+
+    async def aclose(self) -> None:
+        """Close the running loop's pool."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            transport = self._transports.pop(loop, None)
+        if transport is not None:
+            await transport.aclose()
+
+
+@lru_cache(maxsize=None)
+def get_http_clients() -> Tuple[httpx.Client, httpx.AsyncClient]:
+    """
+    Return the process-wide pooled (sync, async) httpx clients.
+
+    The async client is safe to use from any event loop: its connections are
+    pooled per loop by LoopLocalTransport.
+    """
+    return (
+        httpx.Client(limits=HTTP_LIMITS, http2=HTTP2_AVAILABLE),
+        httpx.AsyncClient(
+            transport=LoopLocalTransport(limits=HTTP_LIMITS, http2=HTTP2_AVAILABLE),
+        ),
+    )
+
+
+@lru_cache(maxsize=None)
+def get_default_llm(temperature: float = 0.1) -> ChatGroq:
+    """Return the shared default ChatGroq for the given temperature."""
+    http_client, http_async_client = get_http_clients()
+    return ChatGroq(
+        model=DEFAULT_MODEL,
+        temperature=temperature,
+        http_client=http_client,
+        http_async_client=http_async_client,
+    )
+
+
+async def astream_json(chain: RunnableSequence, inputs: dict) -> dict:
+    """
+    Stream a ``prompt | llm | parser`` chain and return the parsed object.
+
+    The model's tokens are streamed and collected, then the complete text is
+    parsed once with parse_json_strict(). A response that is cut off or has
+    a malformed tail raises OutputParserException instead of yielding a
+    half-filled report, so the caller's fallback path runs.
+    """
+    model = RunnableSequence(chain.first, *chain.middle) if chain.middle else chain.first
+    text = []
+    async for chunk in model.astream(inputs):
+        text.append(chunk.content if hasattr(chunk, "content") else str(chunk))
+
+    result = parse_json_strict("".join(text))
+    if not isinstance(result, dict):
+        raise OutputParserException("LLM response did not contain a JSON object")
+    return result
@@ -5,21 +5,21 @@ Based on approaches from Lopez-Lira & Tang (2023) and FinGPT methodologies.
 """
 
 from typing import Optional
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import JsonOutputParser
-from langchain_groq import ChatGroq
 
-from .state import AnalystState, AnalystReport
+from .base_analyst import BaseAnalyst
+from .state import AnalystState
 
 
-NEWS_ANALYST_PROMPT = """You are a senior financial news analyst specializing in market-moving events.
+# Prompt length dominates LLM latency, so cap how much news is sent.
+MAX_ARTICLES = 15
+MAX_ARTICLE_CHARS = 1000
 
-TASK: Analyze the following news articles for {ticker} and determine their impact on stock price.
 
-NEWS ARTICLES:
-{news_articles}
+# Static persona/task/schema block. Kept free of template variables and
+# sent first so provider-side prompt caching can reuse it across calls.
+NEWS_ANALYST_SYSTEM_PROMPT = """You are a senior financial news analyst specializing in market-moving events.
 
-CURRENT PRICE: ${current_price}
+TASK: Analyze the news articles provided by the user and determine their impact on the stock price.
 
 Analyze each news item for:
 1. Relevance to the company's core business
@@ -36,64 +36,40 @@ Respond in JSON format:
 }}
 """
 
+NEWS_ANALYST_PROMPT = """TICKER: {ticker}
+
+NEWS ARTICLES:
+{news_articles}
+
+CURRENT PRICE: ${current_price}
+"""
+
 
-class NewsAnalyst:
+class NewsAnalyst(BaseAnalyst):
     """News-driven analyst agent that processes market news for trading signals."""
 
-    def __init__(self, llm: Optional[ChatGroq] = None):
-        self.llm = llm or ChatGroq(model="llama-3.3-70b-versatile", temperature=0.1)
-        self.prompt = ChatPromptTemplate.from_template(NEWS_ANALYST_PROMPT)
-        self.parser = JsonOutputParser()
+    ANALYST_TYPE = "news"
+    SYSTEM_PROMPT = NEWS_ANALYST_SYSTEM_PROMPT
+    USER_PROMPT = NEWS_ANALYST_PROMPT
+    MISSING_DATA_REASONING = "No news articles available for analysis."
 
-    def analyze(self, state: AnalystState) -> dict:
-        """Analyze news and return updated state with news analysis."""
-        market_data = state.get("market_data", {})
+    def _prepare_inputs(self, state: AnalystState) -> Optional[dict]:
+        """Build the prompt inputs, or None if there is no news to analyze."""
+        market_data = state.market_data or {}
         news_articles = market_data.get("news_articles", [])
 
         if not news_articles:
-            return {
-                "news_analysis": {
-                    "analyst_type": "news",
-                    "signal": "HOLD",
-                    "confidence": 0.0,
-                    "reasoning": "No news articles available for analysis.",
-                    "key_factors": [],
-                }
-            }
+            return None
 
         news_text = "\n\n".join(
-            [f"[{i+1}] {article}" for i, article in enumerate(news_articles)]
+            [
+                f"[{i+1}] {article[:MAX_ARTICLE_CHARS]}"
+                for i, article in enumerate(news_articles[:MAX_ARTICLES])
+            ]
         )
 
-        chain = self.prompt | self.llm | self.parser
-
-        try:
-            result = chain.invoke({
-                "ticker": state["ticker"],
-                "news_articles": news_text,
-                "current_price": market_data.get("current_price", "N/A"),
-            })
-
-            return {
-                "news_analysis": {
-                    "analyst_type": "news",
-                    "signal": result.get("signal", "HOLD"),
-                    "confidence": float(result.get("confidence", 0.5)),
-                    "reasoning": result.get("reasoning", ""),
-                    "key_factors": result.get("key_factors", []),
-                }
-            }
-        except Exception as e:
-            return {
-                "news_analysis": {
-                    "analyst_type": "news",
-                    "signal": "HOLD",
-                    "confidence": 0.0,
-                    "reasoning": f"Analysis failed: {str(e)}",
-                    "key_factors": [],
-                }
-            }
-
-    def __call__(self, state: AnalystState) -> dict:
-        """Make the analyst callable for LangGraph nodes."""
-        return self.analyze(state)
+        return {
+            "ticker": state.ticker,
+            "news_articles": news_text,
+            "current_price": market_data.get("current_price", "N/A"),
+        }
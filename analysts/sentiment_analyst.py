@@ -4,24 +4,20 @@ Performs market sentiment analysis using social signals, analyst ratings,
 and overall market mood. Inspired by debate-driven agent architectures.
 """
 
-from typing import Optional
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import JsonOutputParser
-from langchain_groq import ChatGroq
+from .base_analyst import BaseAnalyst
+from .state import AnalystState
 
-from .state import AnalystState, AnalystReport
 
+# Number of headlines sent to the LLM and the per-headline length cap.
+MAX_HEADLINES = 10
+MAX_HEADLINE_CHARS = 200
 
-SENTIMENT_PROMPT = """You are a market sentiment specialist analyzing investor psychology and market mood.
 
-TASK: Assess overall market sentiment for {ticker}.
+# Static persona/task/schema block. Kept free of template variables and
+# sent first so provider-side prompt caching can reuse it across calls.
+SENTIMENT_SYSTEM_PROMPT = """You are a market sentiment specialist analyzing investor psychology and market mood.
 
-NEWS HEADLINES:
-{news_headlines}
-
-PRICE ACTION:
-- Current Price: ${current_price}
-- Recent Price Change: {price_change}%
+TASK: Assess overall market sentiment for the stock described by the user.
 
 Analyze sentiment across multiple dimensions:
 1. News tone and media coverage sentiment
@@ -40,18 +36,28 @@ Respond in JSON format:
 }}
 """
 
+SENTIMENT_PROMPT = """TICKER: {ticker}
+
+NEWS HEADLINES:
+{news_headlines}
+
+PRICE ACTION:
+- Current Price: ${current_price}
+- Recent Price Change: {price_change}%
+"""
+
 
-class SentimentAnalyst:
+class SentimentAnalyst(BaseAnalyst):
     """Sentiment analyst evaluating market psychology and investor mood."""
 
-    def __init__(self, llm: Optional[ChatGroq] = None):
-        self.llm = llm or ChatGroq(model="llama-3.3-70b-versatile", temperature=0.2)
-        self.prompt = ChatPromptTemplate.from_template(SENTIMENT_PROMPT)
-        self.parser = JsonOutputParser()
+    ANALYST_TYPE = "sentiment"
+    SYSTEM_PROMPT = SENTIMENT_SYSTEM_PROMPT
+    USER_PROMPT = SENTIMENT_PROMPT
+    TEMPERATURE = 0.2
 
-    def analyze(self, state: AnalystState) -> dict:
-        """Analyze sentiment and return updated state."""
-        market_data = state.get("market_data", {})
+    def _prepare_inputs(self, state: AnalystState) -> dict:
+        """Build the prompt inputs from headlines and price action."""
+        market_data = state.market_data or {}
         news_articles = market_data.get("news_articles", [])
         price_history = market_data.get("price_history", [])
         current_price = market_data.get("current_price", 0)
@@ -61,40 +67,17 @@ class SentimentAnalyst:
         if len(price_history) >= 2:
             price_change = ((price_history[-1] - price_history[0]) / price_history[0]) * 100
 
-        # Extract headlines (first line of each article)
-        headlines = [article.split("\n")[0][:200] for article in news_articles[:10]]
+        # Prefer headlines precomputed by MarketDataFetcher; otherwise take the
+        # first line of each article (partition stops at the first newline).
+        headlines = market_data.get("headlines")
+        if headlines is None:
+            headlines = [article.partition("\n")[0] for article in news_articles[:MAX_HEADLINES]]
+        headlines = [h[:MAX_HEADLINE_CHARS] for h in headlines[:MAX_HEADLINES]]
         headlines_text = "\n".join([f"- {h}" for h in headlines]) if headlines else "No headlines available"
 
-        chain = self.prompt | self.llm | self.parser
-
-        try:
-            result = chain.invoke({
-                "ticker": state["ticker"],
-                "news_headlines": headlines_text,
-                "current_price": current_price,
-                "price_change": f"{price_change:.2f}",
-            })
-
-            return {
-                "sentiment_analysis": {
-                    "analyst_type": "sentiment",
-                    "signal": result.get("signal", "HOLD"),
-                    "confidence": float(result.get("confidence", 0.5)),
-                    "reasoning": result.get("reasoning", ""),
-                    "key_factors": result.get("key_factors", []),
-                }
-            }
-        except Exception as e:
-            return {
-                "sentiment_analysis": {
-                    "analyst_type": "sentiment",
-                    "signal": "HOLD",
-                    "confidence": 0.0,
-                    "reasoning": f"Analysis failed: {str(e)}",
-                    "key_factors": [],
-                }
-            }
-
-    def __call__(self, state: AnalystState) -> dict:
-        """Make the analyst callable for LangGraph nodes."""
-        return self.analyze(state)
+        return {
+            "ticker": state.ticker,
+            "news_headlines": headlines_text,
+            "current_price": current_price,
+            "price_change": f"{price_change:.2f}",
+        }
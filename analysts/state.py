@@ -4,6 +4,8 @@ from typing import TypedDict, List, Optional, Literal
 from dataclasses import dataclass, field
 from datetime import datetime
 
+from pydantic import BaseModel, Field
+
 
 @dataclass
 class MarketData:
@@ -26,13 +28,28 @@ class AnalystReport(TypedDict):
     key_factors: List[str]
 
 
-class AnalystState(TypedDict):
-    """Shared state for the analysts team graph."""
+class AnalystReportModel(BaseModel):
+    """Schema of an analyst's LLM response, used by the JSON output parser."""
+    signal: Literal["BUY", "SELL", "HOLD"] = "HOLD"
+    confidence: float = Field(default=0.5, ge=0.0, le=1.0)
+    reasoning: str = ""
+    key_factors: List[str] = Field(default_factory=list)
+
+
+@dataclass(slots=True)
+class AnalystState:
+    """
+    Shared state for the analysts team graph.
+
+    A dataclass rather than a TypedDict so every field has a default and a
+    new state needs only ``ticker`` and ``market_data``; nodes read it by
+    attribute. Graph results are still returned as plain dicts.
+    """
     ticker: str
-    market_data: dict
-    news_analysis: Optional[AnalystReport]
-    fundamentals_analysis: Optional[AnalystReport]
-    sentiment_analysis: Optional[AnalystReport]
-    technical_analysis: Optional[AnalystReport]
-    consolidated_report: Optional[dict]
-    messages: List[dict]
+    market_data: dict = field(default_factory=dict)
+    news_analysis: Optional[AnalystReport] = None
+    fundamentals_analysis: Optional[AnalystReport] = None
+    sentiment_analysis: Optional[AnalystReport] = None
+    technical_analysis: Optional[AnalystReport] = None
+    consolidated_report: Optional[dict] = None
+    messages: List[dict] = field(default_factory=list)
@@ -4,74 +4,123 @@ Orchestrates multiple analyst agents using LangGraph to produce
 consolidated trading recommendations through parallel analysis and debate.
 """
 
-from typing import Optional, Literal
-from langgraph.graph import StateGraph, END
+import asyncio
+from statistics import mean
+from typing import List, Optional, Literal, Tuple
+from langgraph.graph import StateGraph, START, END
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import JsonOutputParser
+from langchain_core.runnables import RunnableLambda
 from langchain_groq import ChatGroq
 
 from .state import AnalystState
+from .llm import get_default_llm
+from .cache import LLMCache
+from .fast_parser import OrjsonOutputParser
 from .news_analyst import NewsAnalyst
 from .fundamentals_analyst import FundamentalsAnalyst
 from .sentiment_analyst import SentimentAnalyst
 from .technical_analyst import TechnicalAnalyst
+from .batched_analyst import CompositeAnalyst
 
 
-CONSOLIDATION_PROMPT = """You are the Chief Investment Officer consolidating reports from your analyst team.
+# When every analyst agrees at or above this confidence, consolidation is
+# decided by rule instead of an extra LLM call.
+UNANIMOUS_MIN_CONFIDENCE = 0.7
+# Mean confidence above which a unanimous call gets a full position.
+UNANIMOUS_FULL_POSITION_CONFIDENCE = 0.85
+# Analyst reasoning is only sent to the consolidation LLM when confidences
+# are this close; otherwise signals, confidences and key factors decide.
+REASONING_CONFIDENCE_SPREAD = 0.3
 
-TICKER: {ticker}
+# Static persona/task/schema block. Kept free of template variables and
+# sent first so provider-side prompt caching can reuse it across calls.
+CONSOLIDATION_SYSTEM_PROMPT = """You are the Chief Investment Officer consolidating reports from your analyst team.
+
+The user provides signals, confidence levels and key factors from four
+analysts: News, Fundamentals, Sentiment and Technical. When the analysts'
+confidence levels are close, their reasoning is included as well.
+
+Your task:
+1. Weigh each analyst's input based on confidence and supporting evidence
+2. Identify agreements and conflicts between analysts
+3. Synthesize a final recommendation with position sizing guidance
+
+Respond in JSON format:
+{{
+    "final_signal": "BUY" | "SELL" | "HOLD",
+    "confidence": <float 0.0-1.0>,
+    "position_size": "FULL" | "HALF" | "QUARTER" | "NONE",
+    "reasoning": "<consolidated analysis>",
+    "risk_factors": ["<risk1>", "<risk2>", ...],
+    "analyst_agreement": "<description of consensus/disagreement>",
+    "time_horizon": "SHORT" | "MEDIUM" | "LONG"
+}}
+"""
+
+CONSOLIDATION_PROMPT = """TICKER: {ticker}
 
 ANALYST REPORTS:
 
 1. NEWS ANALYST:
    Signal: {news_signal} (Confidence: {news_confidence})
-   Reasoning: {news_reasoning}
    Key Factors: {news_factors}
 
 2. FUNDAMENTALS ANALYST:
    Signal: {fundamentals_signal} (Confidence: {fundamentals_confidence})
-   Reasoning: {fundamentals_reasoning}
    Key Factors: {fundamentals_factors}
 
 3. SENTIMENT ANALYST:
    Signal: {sentiment_signal} (Confidence: {sentiment_confidence})
-   Reasoning: {sentiment_reasoning}
    Key Factors: {sentiment_factors}
 
 4. TECHNICAL ANALYST:
    Signal: {technical_signal} (Confidence: {technical_confidence})
-   Reasoning: {technical_reasoning}
    Key Factors: {technical_factors}
-
-Your task:
-1. Weigh each analyst's input based on confidence and reasoning quality
-2. Identify agreements and conflicts between analysts
-3. Synthesize a final recommendation with position sizing guidance
-
-Respond in JSON format:
-{{
-    "final_signal": "BUY" | "SELL" | "HOLD",
-    "confidence": <float 0.0-1.0>,
-    "position_size": "FULL" | "HALF" | "QUARTER" | "NONE",
-    "reasoning": "<consolidated analysis>",
-    "risk_factors": ["<risk1>", "<risk2>", ...],
-    "analyst_agreement": "<description of consensus/disagreement>",
-    "time_horizon": "SHORT" | "MEDIUM" | "LONG"
-}}
-"""
+{analyst_reasoning}"""
 
 
 class AnalystsTeam:
     """Coordinates multiple analyst agents using LangGraph."""
 
-    def __init__(self, llm: Optional[ChatGroq] = None):
-        self.llm = llm or ChatGroq(model="llama-3.3-70b-versatile", temperature=0.1)
+    def __init__(
+        self,
+        llm: Optional[ChatGroq] = None,
+        cache: Optional[LLMCache] = None,
+        batched: bool = False,
+        max_concurrency: Optional[int] = None,
+    ):
+        """
+        Initialize the Analysts Team.
 
-        # Initialize analyst agents
-        self.news_analyst = NewsAnalyst(llm=self.llm)
-        self.fundamentals_analyst = FundamentalsAnalyst(llm=self.llm)
-        self.sentiment_analyst = SentimentAnalyst(llm=self.llm)
-        self.technical_analyst = TechnicalAnalyst(llm=self.llm)
+        Args:
+            llm: Language model shared by all analysts
+            cache: Optional response cache shared by all analysts
+            batched: If True, produce all four analyst reports in a single
+                LLM call (fewer round-trips) instead of four parallel calls
+            max_concurrency: Maximum analyst LLM calls in flight within one
+                analysis (None runs all four at once); lower it to stay
+                within the Groq rate limit for your tier
+        """
+        self.llm = llm or get_default_llm()
+        self.cache = cache
+        self.batched = batched
+        # Passed to every single-ticker graph run
+        self.run_config = {"max_concurrency": max_concurrency} if max_concurrency else None
+
+        # Initialize analyst agents (sharing one response cache, if any)
+        self.news_analyst = NewsAnalyst(llm=self.llm, cache=cache)
+        self.fundamentals_analyst = FundamentalsAnalyst(llm=self.llm, cache=cache)
+        self.sentiment_analyst = SentimentAnalyst(llm=self.llm, cache=cache)
+        self.technical_analyst = TechnicalAnalyst(llm=self.llm, cache=cache)
+        self.composite_analyst = CompositeAnalyst(llm=self.llm) if batched else None
+
+        # Consolidation chain is built once and reused for every run
+        self.consolidation_prompt = ChatPromptTemplate.from_messages([
+            ("system", CONSOLIDATION_SYSTEM_PROMPT),
+            ("user", CONSOLIDATION_PROMPT),
+        ])
+        self.parser = OrjsonOutputParser()
+        self.consolidation_chain = self.consolidation_prompt | self.llm | self.parser
 
         # Build the graph
         self.graph = self._build_graph()
@@ -82,87 +131,181 @@ class AnalystsTeam:
         # Define the graph with AnalystState
         workflow = StateGraph(AnalystState)
 
-        # Add analyst nodes
-        workflow.add_node("news_analyst", self.news_analyst)
-        workflow.add_node("fundamentals_analyst", self.fundamentals_analyst)
-        workflow.add_node("sentiment_analyst", self.sentiment_analyst)
-        workflow.add_node("technical_analyst", self.technical_analyst)
-        workflow.add_node("consolidate", self._consolidate_reports)
-
-        # Set entry point - all analysts run in parallel from start
-        workflow.set_entry_point("news_analyst")
-
-        # Parallel execution: all analysts feed into consolidation
-        workflow.add_edge("news_analyst", "fundamentals_analyst")
-        workflow.add_edge("fundamentals_analyst", "sentiment_analyst")
-        workflow.add_edge("sentiment_analyst", "technical_analyst")
-        workflow.add_edge("technical_analyst", "consolidate")
+        if self.batched:
+            # Single batched call produces every *_analysis key at once
+            workflow.add_node("composite_analyst", self._node(self.composite_analyst))
+            workflow.add_node(
+                "consolidate",
+                RunnableLambda(self._consolidate_reports, afunc=self._aconsolidate_reports),
+            )
+            workflow.add_edge(START, "composite_analyst")
+            workflow.add_edge("composite_analyst", "consolidate")
+            workflow.add_edge("consolidate", END)
+            return workflow.compile()
+
+        # Add analyst nodes. Each node carries both the sync and async
+        # implementation so the graph works with invoke() and ainvoke().
+        workflow.add_node("news_analyst", self._node(self.news_analyst))
+        workflow.add_node("fundamentals_analyst", self._node(self.fundamentals_analyst))
+        workflow.add_node("sentiment_analyst", self._node(self.sentiment_analyst))
+        workflow.add_node("technical_analyst", self._node(self.technical_analyst))
+        workflow.add_node(
+            "consolidate",
+            RunnableLambda(self._consolidate_reports, afunc=self._aconsolidate_reports),
+        )
+
+        # Fan out - all analysts run in parallel from start. Each analyst
+        # writes its own *_analysis key, so the branches never conflict.
+        analyst_nodes = [
+            "news_analyst",
+            "fundamentals_analyst",
+            "sentiment_analyst",
+            "technical_analyst",
+        ]
+        for node in analyst_nodes:
+            workflow.add_edge(START, node)
+
+        # Fan in - consolidation waits for every analyst to finish
+        workflow.add_edge(analyst_nodes, "consolidate")
         workflow.add_edge("consolidate", END)
 
         return workflow.compile()
 
+    @staticmethod
+    def _node(analyst) -> RunnableLambda:
+        """Wrap an analyst as a graph node exposing sync and async paths."""
+        return RunnableLambda(analyst.analyze, afunc=analyst.analyze_async)
+
     def _consolidate_reports(self, state: AnalystState) -> dict:
         """Consolidate all analyst reports into final recommendation."""
+        reports = self._collect_reports(state)
+        consensus = self._unanimous_consensus(reports)
+        if consensus is not None:
+            return consensus
+
+        inputs = self._consolidation_inputs(state.ticker, reports)
 
-        news = state.get("news_analysis") or {}
-        fundamentals = state.get("fundamentals_analysis") or {}
-        sentiment = state.get("sentiment_analysis") or {}
-        technical = state.get("technical_analysis") or {}
+        try:
+            result = self.consolidation_chain.invoke(inputs)
+            return self._build_consolidated_report(result, reports)
+        except Exception as e:
+            return self._failed_consolidation(e)
 
-        prompt = ChatPromptTemplate.from_template(CONSOLIDATION_PROMPT)
-        parser = JsonOutputParser()
-        chain = prompt | self.llm | parser
+    async def _aconsolidate_reports(self, state: AnalystState) -> dict:
+        """Async variant of _consolidate_reports()."""
+        reports = self._collect_reports(state)
+        consensus = self._unanimous_consensus(reports)
+        if consensus is not None:
+            return consensus
+
+        inputs = self._consolidation_inputs(state.ticker, reports)
 
         try:
-            result = chain.invoke({
-                "ticker": state["ticker"],
-                "news_signal": news.get("signal", "N/A"),
-                "news_confidence": news.get("confidence", 0),
-                "news_reasoning": news.get("reasoning", "N/A"),
-                "news_factors": ", ".join(news.get("key_factors", [])),
-                "fundamentals_signal": fundamentals.get("signal", "N/A"),
-                "fundamentals_confidence": fundamentals.get("confidence", 0),
-                "fundamentals_reasoning": fundamentals.get("reasoning", "N/A"),
-                "fundamentals_factors": ", ".join(fundamentals.get("key_factors", [])),
-                "sentiment_signal": sentiment.get("signal", "N/A"),
-                "sentiment_confidence": sentiment.get("confidence", 0),
-                "sentiment_reasoning": sentiment.get("reasoning", "N/A"),
-                "sentiment_factors": ", ".join(sentiment.get("key_factors", [])),
-                "technical_signal": technical.get("signal", "N/A"),
-                "technical_confidence": technical.get("confidence", 0),
-                "technical_reasoning": technical.get("reasoning", "N/A"),
-                "technical_factors": ", ".join(technical.get("key_factors", [])),
-            })
-
-            return {
-                "consolidated_report": {
-                    "final_signal": result.get("final_signal", "HOLD"),
-                    "confidence": float(result.get("confidence", 0.5)),
-                    "position_size": result.get("position_size", "NONE"),
-                    "reasoning": result.get("reasoning", ""),
-                    "risk_factors": result.get("risk_factors", []),
-                    "analyst_agreement": result.get("analyst_agreement", ""),
-                    "time_horizon": result.get("time_horizon", "MEDIUM"),
-                    "individual_reports": {
-                        "news": news,
-                        "fundamentals": fundamentals,
-                        "sentiment": sentiment,
-                        "technical": technical,
-                    },
-                }
-            }
+            result = await self.consolidation_chain.ainvoke(inputs)
+            return self._build_consolidated_report(result, reports)
         except Exception as e:
-            return {
-                "consolidated_report": {
-                    "final_signal": "HOLD",
-                    "confidence": 0.0,
-                    "position_size": "NONE",
-                    "reasoning": f"Consolidation failed: {str(e)}",
-                    "risk_factors": ["Analysis error"],
-                    "analyst_agreement": "Unable to consolidate",
-                    "time_horizon": "MEDIUM",
-                }
+            return self._failed_consolidation(e)
+
+    def _collect_reports(self, state: AnalystState) -> dict:
+        """Gather the individual analyst reports from state."""
+        return {
+            "news": state.news_analysis or {},
+            "fundamentals": state.fundamentals_analysis or {},
+            "sentiment": state.sentiment_analysis or {},
+            "technical": state.technical_analysis or {},
+        }
+
+    def _unanimous_consensus(self, reports: dict) -> Optional[dict]:
+        """
+        Consolidate by rule when all analysts agree with high confidence.
+
+        Returns None when there is disagreement or low confidence, in which
+        case the LLM consolidation is needed.
+        """
+        present = [report for report in reports.values() if report]
+        if not present:
+            return None
+
+        signals = {report.get("signal") for report in present}
+        confidences = [float(report.get("confidence", 0)) for report in present]
+        if len(signals) != 1 or min(confidences) < UNANIMOUS_MIN_CONFIDENCE:
+            return None
+
+        final_signal = signals.pop()
+        confidence = mean(confidences)
+        if final_signal == "HOLD":
+            position_size = "NONE"
+        elif confidence > UNANIMOUS_FULL_POSITION_CONFIDENCE:
+            position_size = "FULL"
+        else:
+            position_size = "HALF"
+
+        return {
+            "consolidated_report": {
+                "final_signal": final_signal,
+                "confidence": confidence,
+                "position_size": position_size,
+                "reasoning": "Unanimous analyst consensus with high confidence.",
+                "risk_factors": [],
+                "analyst_agreement": f"All {len(present)} analysts agree on {final_signal}",
+                "time_horizon": "MEDIUM",
+                "individual_reports": reports,
+            }
+        }
+
+    def _consolidation_inputs(self, ticker: str, reports: dict) -> dict:
+        """Flatten analyst reports into consolidation prompt variables."""
+        inputs = {"ticker": ticker}
+        for name, report in reports.items():
+            inputs[f"{name}_signal"] = report.get("signal", "N/A")
+            inputs[f"{name}_confidence"] = report.get("confidence", 0)
+            inputs[f"{name}_factors"] = ", ".join(report.get("key_factors", []))
+
+        # Full reasoning dominates the prompt size, so only include it when
+        # the analysts are too close in confidence to call on signals alone.
+        confidences = [r.get("confidence", 0) for r in reports.values()]
+        if max(confidences) - min(confidences) < REASONING_CONFIDENCE_SPREAD:
+            lines = [
+                f"- {name.upper()}: {report.get('reasoning', 'N/A')}"
+                for name, report in reports.items()
+            ]
+            inputs["analyst_reasoning"] = "\nANALYST REASONING:\n" + "\n".join(lines) + "\n"
+        else:
+            inputs["analyst_reasoning"] = ""
+        return inputs
+
+    def _build_consolidated_report(self, result: dict, reports: dict) -> dict:
+        """Convert the parsed consolidation output into a state update."""
+        return {
+            "consolidated_report": {
+                "final_signal": result.get("final_signal", "HOLD"),
+                "confidence": float(result.get("confidence", 0.5)),
+                "position_size": result.get("position_size", "NONE"),
+                "reasoning": result.get("reasoning", ""),
+                "risk_factors": result.get("risk_factors", []),
+                "analyst_agreement": result.get("analyst_agreement", ""),
+                "time_horizon": result.get("time_horizon", "MEDIUM"),
+                "individual_reports": reports,
             }
+        }
+
+    def _failed_consolidation(self, error: Exception) -> dict:
+        """Neutral HOLD report used when consolidation fails."""
+        return {
+            "consolidated_report": {
+                "final_signal": "HOLD",
+                "confidence": 0.0,
+                "position_size": "NONE",
+                "reasoning": f"Consolidation failed: {str(error)}",
+                "risk_factors": ["Analysis error"],
+                "analyst_agreement": "Unable to consolidate",
+                "time_horizon": "MEDIUM",
+            }
+        }
+
+    def _initial_state(self, ticker: str, market_data: dict) -> AnalystState:
+        """Build an empty analyst state for a ticker."""
+        return AnalystState(ticker=ticker, market_data=market_data)
 
     def analyze(self, ticker: str, market_data: dict) -> dict:
         """
@@ -180,34 +323,57 @@ class AnalystsTeam:
         Returns:
             Consolidated analysis report with trading recommendation.
         """
-        initial_state: AnalystState = {
-            "ticker": ticker,
-            "market_data": market_data,
-            "news_analysis": None,
-            "fundamentals_analysis": None,
-            "sentiment_analysis": None,
-            "technical_analysis": None,
-            "consolidated_report": None,
-            "messages": [],
-        }
+        initial_state = self._initial_state(ticker, market_data)
+
+        result = self.graph.invoke(initial_state, config=self.run_config)
+        return result.get("consolidated_report", {})
 
-        result = self.graph.invoke(initial_state)
+    async def analyze_async(self, ticker: str, market_data: dict) -> dict:
+        """
+        Async variant of analyze().
+
+        The four analysts run concurrently on the event loop, overlapping
+        their LLM round-trips.
+        """
+        initial_state = self._initial_state(ticker, market_data)
+
+        result = await self.graph.ainvoke(initial_state, config=self.run_config)
         return result.get("consolidated_report", {})
 
+    async def analyze_many_async(
+        self,
+        inputs: List[Tuple[str, dict]],
+        max_concurrency: int = 10,
+    ) -> List[dict]:
+        """
+        Analyze many tickers concurrently.
+
+        Args:
+            inputs: List of (ticker, market_data) pairs
+            max_concurrency: Maximum graph runs in flight at once; keep this
+                within the Groq rate limit for your tier
+
+        Returns:
+            Consolidated reports in the same order as ``inputs``.
+        """
+        states = [self._initial_state(ticker, market_data) for ticker, market_data in inputs]
+
+        results = await self.graph.abatch(states, config={"max_concurrency": max_concurrency})
+        return [result.get("consolidated_report", {}) for result in results]
+
+    def analyze_many(
+        self,
+        inputs: List[Tuple[str, dict]],
+        max_concurrency: int = 10,
+    ) -> List[dict]:
+        """Synchronous wrapper around analyze_many_async()."""
+        return asyncio.run(self.analyze_many_async(inputs, max_concurrency=max_concurrency))
+
     def get_individual_analysis(self, ticker: str, market_data: dict) -> dict:
         """Run analysis and return all individual analyst reports."""
-        initial_state: AnalystState = {
-            "ticker": ticker,
-            "market_data": market_data,
-            "news_analysis": None,
-            "fundamentals_analysis": None,
-            "sentiment_analysis": None,
-            "technical_analysis": None,
-            "consolidated_report": None,
-            "messages": [],
-        }
+        initial_state = self._initial_state(ticker, market_data)
 
-        result = self.graph.invoke(initial_state)
+        result = self.graph.invoke(initial_state, config=self.run_config)
 
         return {
             "ticker": ticker,
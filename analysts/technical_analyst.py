@@ -4,25 +4,20 @@ Analyzes price patterns, technical indicators, and chart formations.
 Inspired by FinAgent (Zhang et al., 2024b) multimodal technical analysis.
 """
 
-from typing import Optional, List
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import JsonOutputParser
-from langchain_groq import ChatGroq
+from functools import lru_cache
+from typing import Optional, List, Tuple
 
-from .state import AnalystState, AnalystReport
+import numpy as np
 
+from .base_analyst import BaseAnalyst
+from .state import AnalystState
 
-TECHNICAL_PROMPT = """You are a technical analysis expert specializing in price action and indicators.
 
-TASK: Perform technical analysis for {ticker}.
+# Static persona/task/schema block. Kept free of template variables and
+# sent first so provider-side prompt caching can reuse it across calls.
+TECHNICAL_SYSTEM_PROMPT = """You are a technical analysis expert specializing in price action and indicators.
 
-PRICE DATA:
-- Current Price: ${current_price}
-- Price History (recent): {price_history}
-- Volume History (recent): {volume_history}
-
-CALCULATED INDICATORS:
-{indicators}
+TASK: Perform technical analysis on the price data provided by the user.
 
 Analyze:
 1. Trend direction (uptrend, downtrend, sideways)
@@ -40,18 +35,99 @@ Respond in JSON format:
 }}
 """
 
+TECHNICAL_PROMPT = """TICKER: {ticker}
+
+PRICE DATA:
+- Current Price: ${current_price}
+- Price History (recent): {price_history}
+- Volume History (recent): {volume_history}
+
+CALCULATED INDICATORS:
+{indicators}
+"""
+
+
+# Longest lookbacks used by the indicators (SMA-20, 5-day average volume)
+PRICE_WINDOW = 20
+VOLUME_WINDOW = 5
+RSI_PERIOD = 14
+
 
-class TechnicalAnalyst:
+@lru_cache(maxsize=512)
+def _indicators_cached(prices: Tuple[float, ...], volumes: Tuple[int, ...]) -> str:
+    """
+    Calculate basic technical indicators (all but RSI) in a single NumPy pass.
+
+    Only the last PRICE_WINDOW prices and VOLUME_WINDOW volumes affect the
+    result, so those tails form a complete cache key: repeated analyses of
+    the same market snapshot skip recomputation.
+    """
+    if len(prices) < 5:
+        return "Insufficient data for indicator calculation"
+
+    p = np.asarray(prices, dtype=np.float64)
+    indicators = []
+
+    # Simple Moving Averages
+    if p.size >= 10:
+        indicators.append(f"SMA(10): ${p[-10:].mean():.2f}")
+
+    if p.size >= 20:
+        indicators.append(f"SMA(20): ${p[-20:].mean():.2f}")
+
+    # Price momentum
+    momentum_5d = (p[-1] / p[-5] - 1) * 100
+    indicators.append(f"5-day Momentum: {momentum_5d:.2f}%")
+
+    # Volatility (population std dev over 10 days)
+    if p.size >= 10:
+        indicators.append(f"10-day Volatility: ${p[-10:].std():.2f}")
+
+    # Volume trend
+    if len(volumes) >= 5:
+        v = np.asarray(volumes, dtype=np.float64)
+        indicators.append(f"Avg Volume (5d): {int(v.mean()):,}")
+
+    return "\n".join(indicators) if indicators else "No indicators calculated"
+
+
+@lru_cache(maxsize=512)
+def _wilder_rsi(prices: Tuple[float, ...]) -> Optional[float]:
+    """
+    RSI with Wilder's smoothing over the whole series.
+
+    The averages are seeded from the simple mean of the first RSI_PERIOD
+    price changes and smoothed forward through the rest, so the result
+    depends only on ``prices``. Memoized on the full series.
+    """
+    if len(prices) <= RSI_PERIOD:
+        return None
+
+    deltas = np.diff(np.asarray(prices, dtype=np.float64))
+    gains = np.where(deltas > 0, deltas, 0.0)
+    losses = np.where(deltas < 0, -deltas, 0.0)
+
+    avg_gain = float(gains[:RSI_PERIOD].mean())
+    avg_loss = float(losses[:RSI_PERIOD].mean())
+    for gain, loss in zip(gains[RSI_PERIOD:].tolist(), losses[RSI_PERIOD:].tolist()):
+        avg_gain = (avg_gain * (RSI_PERIOD - 1) + gain) / RSI_PERIOD
+        avg_loss = (avg_loss * (RSI_PERIOD - 1) + loss) / RSI_PERIOD
+
+    if avg_loss == 0:
+        return 100.0
+    return 100 - 100 / (1 + avg_gain / avg_loss)
+
+
+class TechnicalAnalyst(BaseAnalyst):
     """Technical analyst using price action and indicators."""
 
-    def __init__(self, llm: Optional[ChatGroq] = None):
-        self.llm = llm or ChatGroq(model="llama-3.3-70b-versatile", temperature=0.1)
-        self.prompt = ChatPromptTemplate.from_template(TECHNICAL_PROMPT)
-        self.parser = JsonOutputParser()
+    ANALYST_TYPE = "technical"
+    SYSTEM_PROMPT = TECHNICAL_SYSTEM_PROMPT
+    USER_PROMPT = TECHNICAL_PROMPT
 
-    def analyze(self, state: AnalystState) -> dict:
-        """Analyze technicals and return updated state."""
-        market_data = state.get("market_data", {})
+    def _prepare_inputs(self, state: AnalystState) -> dict:
+        """Build the prompt inputs from price/volume history."""
+        market_data = state.market_data or {}
         price_history = market_data.get("price_history", [])
         volume_history = market_data.get("volume_history", [])
         current_price = market_data.get("current_price", 0)
@@ -59,104 +135,30 @@ class TechnicalAnalyst:
         # Calculate basic indicators
         indicators = self._calculate_indicators(price_history, volume_history)
 
-        chain = self.prompt | self.llm | self.parser
-
-        try:
-            result = chain.invoke({
-                "ticker": state["ticker"],
-                "current_price": current_price,
-                "price_history": self._format_list(price_history[-20:]),
-                "volume_history": self._format_list(volume_history[-20:]),
-                "indicators": indicators,
-            })
-
-            return {
-                "technical_analysis": {
-                    "analyst_type": "technical",
-                    "signal": result.get("signal", "HOLD"),
-                    "confidence": float(result.get("confidence", 0.5)),
-                    "reasoning": result.get("reasoning", ""),
-                    "key_factors": result.get("key_factors", []),
-                }
-            }
-        except Exception as e:
-            return {
-                "technical_analysis": {
-                    "analyst_type": "technical",
-                    "signal": "HOLD",
-                    "confidence": 0.0,
-                    "reasoning": f"Analysis failed: {str(e)}",
-                    "key_factors": [],
-                }
-            }
+        return {
+            "ticker": state.ticker,
+            "current_price": current_price,
+            "price_history": self._format_list(price_history[-20:]),
+            "volume_history": self._format_list(volume_history[-20:]),
+            "indicators": indicators,
+        }
 
     def _calculate_indicators(self, prices: List[float], volumes: List[int]) -> str:
-        """Calculate basic technical indicators."""
-        if len(prices) < 5:
-            return "Insufficient data for indicator calculation"
-
-        indicators = []
-
-        # Simple Moving Averages
-        if len(prices) >= 10:
-            sma_10 = sum(prices[-10:]) / 10
-            indicators.append(f"SMA(10): ${sma_10:.2f}")
-
-        if len(prices) >= 20:
-            sma_20 = sum(prices[-20:]) / 20
-            indicators.append(f"SMA(20): ${sma_20:.2f}")
-
-        # Price momentum
-        if len(prices) >= 5:
-            momentum_5d = ((prices[-1] - prices[-5]) / prices[-5]) * 100
-            indicators.append(f"5-day Momentum: {momentum_5d:.2f}%")
-
-        # Volatility (simple std dev proxy)
-        if len(prices) >= 10:
-            mean_price = sum(prices[-10:]) / 10
-            variance = sum((p - mean_price) ** 2 for p in prices[-10:]) / 10
-            volatility = variance ** 0.5
-            indicators.append(f"10-day Volatility: ${volatility:.2f}")
-
-        # Volume trend
-        if len(volumes) >= 5:
-            avg_volume = sum(volumes[-5:]) / 5
-            indicators.append(f"Avg Volume (5d): {int(avg_volume):,}")
-
-        # RSI approximation (simplified)
-        if len(prices) >= 14:
-            gains = []
-            losses = []
-            for i in range(-14, -1):
-                change = prices[i + 1] - prices[i]
-                if change > 0:
-                    gains.append(change)
-                    losses.append(0)
-                else:
-                    gains.append(0)
-                    losses.append(abs(change))
-
-            avg_gain = sum(gains) / 14
-            avg_loss = sum(losses) / 14
-
-            if avg_loss == 0:
-                rsi = 100
-            else:
-                rs = avg_gain / avg_loss
-                rsi = 100 - (100 / (1 + rs))
-
-            indicators.append(f"RSI(14): {rsi:.1f}")
-
-        return "\n".join(indicators) if indicators else "No indicators calculated"
+        """Calculate basic technical indicators (memoized on the tail window)."""
+        indicators = _indicators_cached(
+            tuple(prices[-PRICE_WINDOW:]),
+            tuple(volumes[-VOLUME_WINDOW:]),
+        )
+
+        rsi = _wilder_rsi(tuple(prices))
+        if rsi is not None:
+            indicators += f"\nRSI({RSI_PERIOD}): {rsi:.1f}"
+        return indicators
 
     def _format_list(self, data: list) -> str:
         """Format a list for display."""
-        if not data:
+        if len(data) == 0:
             return "N/A"
         if len(data) <= 5:
             return str(data)
         return f"[...{len(data)} values, latest: {data[-5:]}]"
-
-    def __call__(self, state: AnalystState) -> dict:
-        """Make the analyst callable for LangGraph nodes."""
-        return self.analyze(state)
@@ -0,0 +1,61 @@
+"""Small on-disk TTL cache for fetched market data."""
+
+import hashlib
+import os
+import pickle
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+
+DEFAULT_CACHE_DIR = ".cache"
+
+
+class FileCache:
+    """
+    One pickle file per key under ``<cache_dir>/<namespace>/``.
+
+    Entries expire ``ttl_seconds`` after they were written. The cache is
+    best-effort: unreadable or unwritable files are treated as misses, so a
+    broken cache directory never breaks a fetch.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, ttl_seconds: float = 3600.0):
+        self.cache_dir = Path(cache_dir)
+        self.ttl_seconds = ttl_seconds
+
+    def get(self, namespace: str, key: str, ttl_seconds: Optional[float] = None) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        path = self._path(namespace, key)
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        try:
+            if time.time() - path.stat().st_mtime >= ttl:
+                return None
+            with path.open("rb") as f:
+                return pickle.load(f)
+        except (OSError, pickle.PickleError, EOFError):
+            return None
+
+    def set(self, namespace: str, key: str, value: Any) -> None:
+        """Store a value, replacing the file atomically."""
+        path = self._path(namespace, key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        except OSError:
+            return
+
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except Exception:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+
+    def _path(self, namespace: str, key: str) -> Path:
+        digest = hashlib.md5(key.encode("utf-8")).hexdigest()
+        return self.cache_dir / namespace / f"{digest}.pkl"
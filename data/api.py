@@ -1,8 +1,13 @@
 """Flask API endpoints for the TradingAgents data module."""
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
 from flask_cors import CORS
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .news_scraper import NewsScraper
 from .stock_data import StockDataFetcher
 from .market_data import MarketDataFetcher
@@ -10,6 +15,19 @@ from .market_data import MarketDataFetcher
 app = Flask(__name__)
 CORS(app)
 
+# Shared across requests so HTTP sessions, connection pools and caches
+# survive between calls
+news_scraper = NewsScraper()
+stock_fetcher = StockDataFetcher()
+market_data_fetcher = MarketDataFetcher()
+
+# orjson encodes datetimes and NumPy values natively; NaN becomes null
+ORJSON_OPTIONS = (orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC) if orjson else 0
+
+# Browser/proxy cache lifetime for news responses (matches the scraper's
+# HTTP cache TTL)
+NEWS_CACHE_MAX_AGE = 600
+
 # Fallback news data
 FALLBACK_NEWS = [
     {
@@ -21,6 +39,19 @@ FALLBACK_NEWS = [
 ]
 
 
+def json_response(payload, status: int = 200) -> Response:
+    """Serialize a payload with orjson, falling back to Flask's jsonify."""
+    if orjson is None:
+        response = jsonify(payload)
+        response.status_code = status
+        return response
+    return Response(
+        orjson.dumps(payload, option=ORJSON_OPTIONS, default=str),
+        status=status,
+        mimetype="application/json",
+    )
+
+
 @app.route("/api/news", methods=["GET"])
 def get_news():
     """
@@ -33,11 +64,12 @@ def get_news():
     limit = int(request.args.get("limit", 15))
 
     try:
-        scraper = NewsScraper()
-        result = scraper.to_dict(keyword=keyword, num_days=days, limit=limit)
-        return jsonify(result)
+        result = news_scraper.to_dict(keyword=keyword, num_days=days, limit=limit)
+        response = json_response(result)
+        response.headers["Cache-Control"] = f"public, max-age={NEWS_CACHE_MAX_AGE}"
+        return response
     except Exception as e:
-        return jsonify({"error": str(e), "articles": FALLBACK_NEWS}), 200
+        return json_response({"error": str(e), "articles": FALLBACK_NEWS}, 200)
 
 
 @app.route("/api/stock/<symbol>", methods=["GET"])
@@ -48,17 +80,16 @@ def get_stock_data(symbol: str):
     Returns stock data with technical indicators.
     """
     try:
-        fetcher = StockDataFetcher()
-        indicators = fetcher.get_technical_indicators(symbol)
-        info = fetcher.get_company_info(symbol)
+        indicators = stock_fetcher.get_technical_indicators(symbol)
+        info = stock_fetcher.get_company_info(symbol)
 
-        return jsonify({
+        return json_response({
             "symbol": symbol,
             "info": info,
             "indicators": indicators,
         })
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return json_response({"error": str(e)}, 500)
 
 
 @app.route("/api/market-data/<ticker>", methods=["GET"])
@@ -73,27 +104,31 @@ def get_market_data(ticker: str):
     news_limit = int(request.args.get("news_limit", 10))
 
     try:
-        fetcher = MarketDataFetcher()
-        data = fetcher.fetch_market_data(
+        data = market_data_fetcher.fetch_market_data(
             ticker=ticker,
             news_days=news_days,
             price_days=price_days,
             news_limit=news_limit,
         )
-        return jsonify({"ticker": ticker, "market_data": data})
+        return json_response({"ticker": ticker, "market_data": data})
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return json_response({"error": str(e)}, 500)
 
 
 @app.route("/api/health", methods=["GET"])
 def health_check():
     """Health check endpoint."""
-    return jsonify({"status": "ok"})
+    return json_response({"status": "ok"})
+
 
+def run_api(port: int = 5001, debug: bool = False):
+    """
+    Run the Flask development server.
 
-def run_api(port: int = 5001, debug: bool = True):
-    """Run the Flask API server."""
-    app.run(port=port, debug=debug)
+    For production, serve ``data.api:app`` with gunicorn and gevent workers:
+        gunicorn -k gevent -w 4 --worker-connections 100 data.api:app
+    """
+    app.run(port=port, debug=debug, threaded=True)
 
 
 if __name__ == "__main__":
@@ -1,10 +1,26 @@
 """Unified market data fetcher for LangGraph TradingAgents."""
 
-from typing import Dict, List, Any
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional
 
+from cachetools import TTLCache
+
+from ._cache import DEFAULT_CACHE_DIR, FileCache
 from .news_scraper import NewsScraper
 from .stock_data import StockDataFetcher
 
+# Assembled market data shared across fetchers, keyed by
+# (ticker, news_keyword, news_days, news_limit, price_days).
+MARKET_DATA_CACHE_TTL = 300
+# Lifetime of assembled market data on disk, so reruns within this window
+# (separate processes) skip every fetch
+MARKET_DATA_DISK_TTL = 900
+# Symbols per yf.download request in fetch_market_data_batch
+BATCH_CHUNK_SIZE = 10
+_market_data_cache: TTLCache = TTLCache(maxsize=256, ttl=MARKET_DATA_CACHE_TTL)
+_market_data_cache_lock = threading.Lock()
+
 
 class MarketDataFetcher:
     """
@@ -12,10 +28,29 @@ class MarketDataFetcher:
     for the LangGraph AnalystsTeam.
     """
 
-    def __init__(self, verbose: bool = False):
-        self.news_scraper = NewsScraper(verbose=verbose)
-        self.stock_fetcher = StockDataFetcher(verbose=verbose)
+    def __init__(
+        self,
+        verbose: bool = False,
+        use_cache: bool = True,
+        cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
+    ):
+        """
+        Args:
+            verbose: Log fetches and cache hits
+            use_cache: Serve results from the memory and disk caches,
+                including the news scraper's page and HTTP caches. When
+                False every call fetches fresh data (results are still
+                written back to the caches).
+            cache_dir: Directory for the on-disk caches (None disables them)
+        """
+        self.news_scraper = NewsScraper(verbose=verbose, use_cache=use_cache)
+        self.stock_fetcher = StockDataFetcher(
+            verbose=verbose,
+            cache_dir=cache_dir if use_cache else None,
+        )
         self.verbose = verbose
+        self.use_cache = use_cache
+        self.file_cache = FileCache(cache_dir, ttl_seconds=MARKET_DATA_DISK_TTL) if cache_dir else None
 
     def _log(self, msg: str) -> None:
         if self.verbose:
@@ -46,9 +81,41 @@ class MarketDataFetcher:
                 "price_history": List[float],
                 "volume_history": List[int],
                 "news_articles": List[str],
+                "headlines": List[str],
                 "financial_reports": dict,
+                "technical_indicators": dict,
             }
         """
+        key = (ticker, news_keyword, news_days, news_limit, price_days)
+        disk_key = ":".join(map(str, key))
+        if self.use_cache:
+            with _market_data_cache_lock:
+                cached = _market_data_cache.get(key)
+            if cached is None and self.file_cache:
+                cached = self.file_cache.get("market_data", disk_key)
+                if cached is not None:
+                    with _market_data_cache_lock:
+                        _market_data_cache[key] = cached
+            if cached is not None:
+                self._log(f"Cache hit for {ticker}")
+                return dict(cached)
+
+        market_data = self._fetch_market_data(ticker, news_keyword, news_days, news_limit, price_days)
+        with _market_data_cache_lock:
+            _market_data_cache[key] = market_data
+        if self.file_cache:
+            self.file_cache.set("market_data", disk_key, market_data)
+        return dict(market_data)
+
+    def _fetch_market_data(
+        self,
+        ticker: str,
+        news_keyword: str,
+        news_days: int,
+        news_limit: int,
+        price_days: int,
+    ) -> Dict[str, Any]:
+        """Fetch news and stock data from the sources (uncached)."""
         self._log(f"Fetching market data for {ticker}")
 
         # Use ticker as news keyword if not specified
@@ -56,26 +123,34 @@ class MarketDataFetcher:
             # Extract company name from ticker for better news matching
             news_keyword = ticker.split(".")[0]
 
-        # Fetch news
-        self._log("Fetching news articles...")
-        news_articles = self.news_scraper.get_news_articles(
-            keyword=news_keyword,
-            num_days=news_days,
-            limit=news_limit,
-        )
-
-        # Fetch stock data
-        self._log("Fetching stock data...")
-        indicators = self.stock_fetcher.get_technical_indicators(ticker)
-        price_history = self.stock_fetcher.get_price_history(ticker, days=price_days)
-        volume_history = self.stock_fetcher.get_volume_history(ticker, days=price_days)
-        financial_reports = self.stock_fetcher.get_financial_reports(ticker)
+        # News and stock data are independent network requests, so run them
+        # concurrently: wall time is the slowest call rather than the sum.
+        self._log("Fetching news articles and stock data...")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            news_future = executor.submit(
+                self.news_scraper.get_news_articles,
+                keyword=news_keyword,
+                num_days=news_days,
+                limit=news_limit,
+            )
+            # One history load feeds indicators, price/volume and reports
+            stock_future = executor.submit(self.stock_fetcher.analyze_symbol, ticker, price_days=price_days)
+
+            news_articles = news_future.result()
+            stock = stock_future.result()
+
+        indicators = stock["technical_indicators"]
+        price_history = stock["price_history"]
+        volume_history = stock["volume_history"]
+        financial_reports = stock["financial_reports"]
 
         market_data = {
             "current_price": indicators.get("current_price", 0),
             "price_history": price_history,
             "volume_history": volume_history,
             "news_articles": news_articles,
+            # First line of each article, so analysts don't re-split per call
+            "headlines": [article.partition("\n")[0] for article in news_articles],
             "financial_reports": financial_reports,
             "technical_indicators": indicators,
         }
@@ -83,6 +158,53 @@ class MarketDataFetcher:
         self._log(f"Fetched: {len(news_articles)} news, {len(price_history)} prices")
         return market_data
 
+    def fetch_market_data_batch(
+        self,
+        tickers: List[str],
+        news_days: int = 7,
+        news_limit: int = 10,
+        price_days: int = 60,
+        max_workers: int = 8,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch market data for many tickers at once.
+
+        Price history is downloaded with one yf.download request per
+        BATCH_CHUNK_SIZE tickers; the per-ticker assembly (news scraping,
+        company info) then runs concurrently and reads history from the
+        warmed cache. Tickers that fail are left out of the result.
+
+        Returns:
+            Mapping of ticker to its fetch_market_data() result
+        """
+        unique = list(dict.fromkeys(tickers))
+        if not unique:
+            return {}
+
+        for i in range(0, len(unique), BATCH_CHUNK_SIZE):
+            self.stock_fetcher.get_historical_data_bulk(unique[i:i + BATCH_CHUNK_SIZE])
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(unique)))) as executor:
+            futures = {
+                ticker: executor.submit(
+                    self.fetch_market_data,
+                    ticker,
+                    news_days=news_days,
+                    news_limit=news_limit,
+                    price_days=price_days,
+                )
+                for ticker in unique
+            }
+            for ticker, future in futures.items():
+                try:
+                    results[ticker] = future.result()
+                except Exception as e:
+                    self._log(f"Error fetching {ticker}: {e}")
+
+        self._log(f"Batch fetched market data for {len(results)}/{len(unique)} tickers")
+        return results
+
     def fetch_for_analysts(
         self,
         ticker: str,
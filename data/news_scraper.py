@@ -1,19 +1,67 @@
 """News scraper for financial news from Money Control."""
 
 import random
+import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
+from cachetools import TTLCache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from selectolax.lexbor import LexborHTMLParser, LexborNode
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+# Article containers seen across Money Control layouts, matched in one pass.
+# Containers can nest, so the same article may match more than once; parsed
+# articles are deduplicated by link (or title).
+ARTICLE_SELECTOR = "li.clearfix, div.article-list, div.article_box, div.news_listing"
+# Per-field selectors in priority order (first selector with a match wins)
+TITLE_SELECTORS = ("h2", "h1", "a.headline")
+TIMESTAMP_SELECTORS = ("span.article_schedule", "span.date", "time")
+
+# Relative ("5 mins ago") and absolute timestamp formats used on the site
+RELATIVE_DATE_RE = re.compile(r"(\d+)\s*(min|hour|day)")
+RELATIVE_DATE_UNITS = {"min": 60, "hour": 3600, "day": 86400}
+ABSOLUTE_DATE_FORMATS = ["%B %d, %Y %I:%M %p", "%b %d, %Y %I:%M %p", "%d %B %Y"]
+
+# Upper bound on concurrent page requests
+MAX_PAGE_WORKERS = 4
+
+# Minimum spacing (seconds, randomly jittered) between requests to one host.
+# Shared across workers and scraper instances, so fetching pages concurrently
+# overlaps their latency without raising the request rate on the site.
+REQUEST_INTERVAL = (1.0, 2.0)
+_next_request_at: Dict[str, float] = {}
+_request_lock = threading.Lock()
+
+# On-disk HTTP cache for listing pages (used when requests-cache is installed)
+HTTP_CACHE_NAME = "moneycontrol_cache"
+HTTP_CACHE_TTL = 600
+
+# Parsed listing pages shared by every NewsScraper in the process, keyed by
+# page URL so scrapes for different keywords (tickers) share one fetch.
+# Values are tuples of article dicts so callers can't mutate the cached copy.
+PAGE_CACHE_TTL = 300
+_page_cache: TTLCache = TTLCache(maxsize=64, ttl=PAGE_CACHE_TTL)
+# One lock per URL, so concurrent scrapes wait for a single fetch
+_page_locks: Dict[str, threading.Lock] = {}
+_page_cache_lock = threading.Lock()
 
 
 class NewsScraper:
     """Scrapes financial news from Money Control for use in LangGraph agents."""
 
-    def __init__(self, verbose: bool = False):
+    def __init__(self, verbose: bool = False, use_cache: bool = True):
         self.headers = {
             "User-Agent": (
                 "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -24,77 +72,128 @@ class NewsScraper:
         self.base_url = "https://www.moneycontrol.com/news/business/stocks"
         self.source = "Money Control"
         self.verbose = verbose
+        # When False, pages are always fetched from the site (fresh copies
+        # are still written back to the page and HTTP caches)
+        self.use_cache = use_cache
+
+        # Keep-alive session so page fetches reuse one TCP/TLS connection.
+        # With requests-cache, unchanged pages (and 404s) are served from a
+        # local SQLite cache, honouring Cache-Control/ETag from the site.
+        if requests_cache is not None:
+            self.session = requests_cache.CachedSession(
+                HTTP_CACHE_NAME,
+                backend="sqlite",
+                expire_after=HTTP_CACHE_TTL,
+                cache_control=True,
+                allowable_codes=(200, 404),
+            )
+        else:
+            self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+        )
+        self.session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry),
+        )
 
     def _log(self, msg: str) -> None:
         if self.verbose:
             print(f"[NewsScraper] {msg}")
 
-    def _get_soup(self, url: str) -> Optional[BeautifulSoup]:
+    def _throttle(self, url: str) -> None:
+        """Wait for this host's next request slot, then reserve the one after."""
+        host = urlsplit(url).netloc
+        with _request_lock:
+            now = time.monotonic()
+            start = max(now, _next_request_at.get(host, now))
+            _next_request_at[host] = start + random.uniform(*REQUEST_INTERVAL)
+        if start > now:
+            time.sleep(start - now)
+
+    def _fetch(self, url: str) -> requests.Response:
+        """GET a page, waiting for a rate-limit slot only if it hits the network."""
+        if requests_cache is None:
+            self._throttle(url)
+            return self.session.get(url, timeout=10)
+
+        if self.use_cache:
+            # 504 means the page isn't in the HTTP cache (or has expired)
+            response = self.session.get(url, timeout=10, only_if_cached=True)
+            if response.status_code != 504:
+                return response
+        self._throttle(url)
+        # force_refresh skips the cached copy but still stores the fresh one
+        return self.session.get(url, timeout=10, force_refresh=not self.use_cache)
+
+    def _get_tree(self, url: str) -> Optional[LexborHTMLParser]:
         try:
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = self._fetch(url)
             response.raise_for_status()
             self._log(f"Fetched: {url}")
-            return BeautifulSoup(response.text, "html.parser")
+            # Hand Lexbor the raw bytes: skips building a decoded copy of
+            # the page and requests' charset detection.
+            return LexborHTMLParser(response.content)
         except requests.RequestException as e:
             self._log(f"Error fetching {url}: {e}")
             return None
 
-    def _parse_date(self, date_str: str) -> Optional[datetime]:
-        if not date_str:
-            return None
-
-        date_str = date_str.lower().strip()
-        now = datetime.now()
+    def _parse_dates(self, date_strs: List[Optional[str]], now: datetime) -> List[Optional[datetime]]:
+        """
+        Parse article timestamps in vectorized passes.
 
-        try:
-            if "min" in date_str:
-                mins = int("".join(filter(str.isdigit, date_str)) or "0")
-                return now - timedelta(minutes=mins)
-            elif "hour" in date_str:
-                hours = int("".join(filter(str.isdigit, date_str)) or "0")
-                return now - timedelta(hours=hours)
-            elif "day" in date_str:
-                days = int("".join(filter(str.isdigit, date_str)) or "0")
-                return now - timedelta(days=days)
-            else:
-                for fmt in ["%B %d, %Y %I:%M %p", "%b %d, %Y %I:%M %p", "%d %B %Y"]:
-                    try:
-                        return datetime.strptime(date_str, fmt)
-                    except ValueError:
-                        continue
-        except Exception:
-            pass
+        Handles relative ("5 mins ago", "2 hours ago", "3 days ago") and the
+        absolute formats in ABSOLUTE_DATE_FORMATS. Unparseable values are None.
+        """
+        text = pd.Series(date_strs, dtype="object").fillna("").str.lower().str.strip()
+
+        # Relative timestamps: one regex extraction for every row
+        relative = text.str.extract(RELATIVE_DATE_RE)
+        seconds = pd.to_numeric(relative[0], errors="coerce") * relative[1].map(RELATIVE_DATE_UNITS)
+        dates = pd.Timestamp(now) - pd.to_timedelta(seconds, unit="s")
+
+        # Absolute timestamps: one strict pass per known format
+        for fmt in ABSOLUTE_DATE_FORMATS:
+            missing = dates.isna()
+            if not missing.any():
+                break
+            dates = dates.fillna(pd.to_datetime(text.where(missing), format=fmt, errors="coerce"))
+
+        return [None if pd.isna(d) else d.to_pydatetime() for d in dates]
+
+    @staticmethod
+    def _first_match(node: LexborNode, selectors: Tuple[str, ...]) -> Optional[LexborNode]:
+        """Return the first element matching the highest-priority selector."""
+        for selector in selectors:
+            match = node.css_first(selector)
+            if match is not None:
+                return match
         return None
 
-    def _extract_article(self, article) -> Optional[dict]:
+    def _extract_article(self, article: LexborNode) -> Optional[dict]:
         try:
-            title_tag = (
-                article.find("h2")
-                or article.find("h1")
-                or article.find("a", class_="headline")
-            )
+            title_tag = self._first_match(article, TITLE_SELECTORS)
             if not title_tag:
                 return None
 
-            title = title_tag.get_text().strip()
-            link_tag = title_tag.find("a") if title_tag.name != "a" else title_tag
-            url = link_tag.get("href") if link_tag else None
+            title = title_tag.text().strip()
+            link_tag = title_tag.css_first("a") if title_tag.tag != "a" else title_tag
+            url = link_tag.attributes.get("href") if link_tag else None
 
-            timestamp = (
-                article.find("span", class_="article_schedule")
-                or article.find("span", class_="date")
-                or article.find("time")
-            )
-            date_str = timestamp.text.strip() if timestamp else None
-            date = self._parse_date(date_str)
+            timestamp = self._first_match(article, TIMESTAMP_SELECTORS)
+            date_str = timestamp.text().strip() if timestamp else None
 
             self._log(f"Found: {title[:50]}...")
 
             return {
                 "title": title,
                 "url": url,
-                "date": date,
+                "date": None,
                 "source": self.source,
+                "date_str": date_str,
             }
         except Exception as e:
             self._log(f"Extract error: {e}")
@@ -106,7 +205,7 @@ class NewsScraper:
         num_days: int = 7,
         num_pages: int = 3,
         limit: int = 20,
-    ) -> pd.DataFrame:
+    ) -> List[dict]:
         """
         Scrape news articles.
 
@@ -117,47 +216,125 @@ class NewsScraper:
             limit: Max articles to return
 
         Returns:
-            DataFrame with columns: title, url, date, source
+            Article dicts with keys title, url, date, source, newest first
         """
-        all_articles = []
         cutoff = datetime.now() - timedelta(days=num_days)
+        urls = [f"{self.base_url}/page-{page}" for page in range(1, num_pages + 1)]
+        if not urls:
+            return []
+
+        # Links (or titles) already collected, shared across pages
+        seen = set()
+
+        # Listing pages run newest-first, so page 1 alone often settles the
+        # query. Only when it doesn't are the remaining pages fetched, and
+        # those concurrently since they are independent.
+        recent, reached_cutoff = self._collect_page(self._page_articles(urls[0]), keyword, cutoff, seen)
+
+        if len(recent) < limit and not reached_cutoff and len(urls) > 1:
+            workers = min(len(urls) - 1, MAX_PAGE_WORKERS)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                pages = list(executor.map(self._page_articles, urls[1:]))
+
+            for page_articles in pages:
+                articles, reached_cutoff = self._collect_page(page_articles, keyword, cutoff, seen)
+                recent.extend(articles)
+                if len(recent) >= limit or reached_cutoff:
+                    break
+
+        # Newest first, undated articles last
+        recent.sort(key=lambda a: a["date"] or datetime.min, reverse=True)
+        return recent[:limit]
+
+    def _page_articles(self, url: str) -> Tuple[dict, ...]:
+        """
+        Return every article on one listing page, parsed and deduplicated.
 
-        for page in range(1, num_pages + 1):
-            url = f"{self.base_url}/page-{page}"
-            soup = self._get_soup(url)
-            if not soup:
-                continue
+        Pages are cached per URL for PAGE_CACHE_TTL seconds, whatever the
+        keyword; concurrent calls for the same URL share one fetch. Failed
+        fetches are not cached. With use_cache=False the page is always
+        fetched.
+        """
+        if not self.use_cache:
+            return self._load_page(url)
+
+        with _page_cache_lock:
+            lock = _page_locks.setdefault(url, threading.Lock())
+
+        with lock:
+            with _page_cache_lock:
+                articles = _page_cache.get(url)
+            if articles is not None:
+                self._log(f"Cache hit: {url}")
+                return articles
+            return self._load_page(url)
+
+    def _load_page(self, url: str) -> Tuple[dict, ...]:
+        """Fetch and parse one listing page, storing it in the page cache."""
+        tree = self._get_tree(url)
+        if not tree:
+            return ()
+        articles = self._parse_page(tree)
+        self._log(f"{url}: {len(articles)} articles")
+        with _page_cache_lock:
+            _page_cache[url] = articles
+        return articles
 
-            containers = (
-                soup.find_all("li", class_="clearfix")
-                or soup.find_all("div", class_="article-list")
-                or soup.find_all("div", class_="article_box")
-                or soup.find_all("div", class_="news_listing")
-            )
-            self._log(f"Page {page}: {len(containers)} items")
+    def _parse_page(self, tree: LexborHTMLParser) -> Tuple[dict, ...]:
+        """Extract the articles on a listing page, dropping repeated ones."""
+        articles = []
+        seen = set()
+        for item in tree.css(ARTICLE_SELECTOR):
+            data = self._extract_article(item)
+            if not data:
+                continue
 
-            for item in containers:
-                data = self._extract_article(item)
-                if not data:
-                    continue
+            # Nested containers repeat the same article
+            key = data["url"] or data["title"]
+            if key in seen:
+                continue
+            seen.add(key)
+            articles.append(data)
 
-                # Keyword filter
-                if keyword and keyword.lower() not in data["title"].lower():
-                    continue
+        # Parse the page's timestamps at once (relative ones against now)
+        dates = self._parse_dates([a.pop("date_str") for a in articles], datetime.now())
+        for data, date in zip(articles, dates):
+            data["date"] = date
+        return tuple(articles)
 
-                # Date filter
-                if data["date"] and data["date"] < cutoff:
-                    continue
+    def _collect_page(
+        self,
+        articles: Tuple[dict, ...],
+        keyword: str,
+        cutoff: datetime,
+        seen: set,
+    ) -> Tuple[List[dict], bool]:
+        """
+        Select the articles from one parsed listing page that match a query.
 
-                all_articles.append(data)
+        Articles whose link (or title, if unlinked) is already in ``seen``
+        are skipped, and new ones are added to it. Returns copies of the
+        articles within the date window and whether any article on the page
+        was older than the cutoff (later pages are older still).
+        """
+        recent = []
+        reached_cutoff = False
+        for data in articles:
+            # Keyword filter
+            if keyword and keyword.lower() not in data["title"].lower():
+                continue
 
-            time.sleep(random.uniform(1, 2))
+            # Listing pages shift while being read, repeating articles
+            key = data["url"] or data["title"]
+            if key in seen:
+                continue
+            seen.add(key)
 
-        df = pd.DataFrame(all_articles)
-        if not df.empty:
-            df = df.sort_values("date", ascending=False, na_position="last")
-            df = df.head(limit)
-        return df
+            if data["date"] and data["date"] < cutoff:
+                reached_cutoff = True
+                continue
+            recent.append(dict(data))
+        return recent, reached_cutoff
 
     def get_news_articles(
         self,
@@ -172,22 +349,21 @@ class NewsScraper:
         Returns:
             List of news article strings ready for LLM consumption.
         """
-        df = self.scrape(keyword, num_days, num_pages, limit)
-
-        articles = []
-        for _, row in df.iterrows():
-            parts = [row.get("title", "")]
-            if row.get("source"):
-                parts.append(f"Source: {row['source']}")
-            if row.get("date"):
-                date_val = row["date"]
-                if hasattr(date_val, "isoformat"):
-                    parts.append(f"Date: {date_val.isoformat()}")
-            if row.get("url"):
-                parts.append(f"URL: {row['url']}")
-            articles.append("\n".join(parts))
-
-        return articles
+        return [
+            self._format_article(article)
+            for article in self.scrape(keyword, num_days, num_pages, limit)
+        ]
+
+    def _format_article(self, article: dict) -> str:
+        """Format one scraped article as a multi-line string for the LLM."""
+        parts = [article["title"]]
+        if article["source"]:
+            parts.append(f"Source: {article['source']}")
+        if article["date"]:
+            parts.append(f"Date: {article['date'].isoformat()}")
+        if article["url"]:
+            parts.append(f"URL: {article['url']}")
+        return "\n".join(parts)
 
     def to_dict(
         self,
@@ -197,16 +373,16 @@ class NewsScraper:
         limit: int = 15,
     ) -> dict:
         """Get news as dictionary for JSON serialization."""
-        df = self.scrape(keyword, num_days, num_pages, limit)
-        records = df.to_dict(orient="records")
+        articles = self.scrape(keyword, num_days, num_pages, limit)
+        news_articles = [self._format_article(article) for article in articles]
 
-        for r in records:
-            if r.get("date") and hasattr(r["date"], "isoformat"):
-                r["date"] = r["date"].isoformat()
+        for article in articles:
+            if article["date"]:
+                article["date"] = article["date"].isoformat()
 
         return {
             "keyword": keyword,
             "source": self.source,
-            "news_articles": self.get_news_articles(keyword, num_days, num_pages, limit),
-            "articles": records,
+            "news_articles": news_articles,
+            "articles": articles,
         }
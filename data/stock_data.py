@@ -1,51 +1,374 @@
 """Stock data fetcher with technical indicators using yfinance."""
 
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 
 try:
     import yfinance as yf
 except ImportError:
     yf = None
 
+try:
+    from yfinance.exceptions import YFTzMissingError
+except ImportError:
+    YFTzMissingError = None
+
+from ._cache import DEFAULT_CACHE_DIR, FileCache
+from ._njit import njit
+
+
+# History is always fetched for at least this many days so that shorter
+# requests (price/volume history, quick summaries) are served by slicing.
+MIN_HISTORY_DAYS = 365
+# Lifetime of cached OHLCV history, in memory and on disk
+HISTORY_TTL_SECONDS = 3600.0
+# Lifetime of cached yf.Ticker.info payloads on disk. Fundamentals change
+# slowly, but the payload also carries market cap and 52-week range.
+INFO_TTL_SECONDS = 86400.0
+# Symbols Yahoo confirmed it doesn't know (no timezone found) are rejected
+# without a request for this long, so typos don't spend a round trip (and
+# rate-limit budget)
+INVALID_SYMBOL_TTL_SECONDS = 86400.0
+# An empty history without that confirmation may be a transient failure
+# (network error, rate limit), so the symbol is only skipped briefly, in
+# memory
+EMPTY_HISTORY_RETRY_SECONDS = 300.0
+# Shape of a Yahoo symbol: AAPL, TCS.NS, BRK-B, ^GSPC, EURUSD=X, M&M.NS
+SYMBOL_RE = re.compile(r"^[A-Za-z0-9^][A-Za-z0-9.\-=^&]{0,19}$")
+
+# Default indicator periods and their precomputed EWM smoothing factors
+RSI_PERIOD = 14
+MACD_FAST = 12
+MACD_SLOW = 26
+MACD_SIGNAL = 9
+BB_WINDOW = 20
+BB_NUM_STD = 2.0
+ALPHA_FAST = 2.0 / (MACD_FAST + 1)
+ALPHA_SLOW = 2.0 / (MACD_SLOW + 1)
+ALPHA_SIGNAL = 2.0 / (MACD_SIGNAL + 1)
+ALPHA_RSI = 1.0 / RSI_PERIOD
+
+
+@njit(cache=True)
+def _sma_last(values, window):
+    """Latest simple moving average, or NaN with fewer than ``window`` values."""
+    n = values.shape[0]
+    if n < window:
+        return np.nan
+    return values[n - window:].mean()
+
+
+@njit(cache=True)
+def _mean_std_last(values, window):
+    """Mean and sample std (ddof=1) of the last ``window`` values."""
+    tail = values[values.shape[0] - window:]
+    mean = tail.mean()
+    return mean, np.sqrt(((tail - mean) ** 2).sum() / (window - 1))
+
+
+@njit(cache=True)
+def _indicators_kernel(closes, a_rsi, a_fast, a_slow, a_signal, bb_window, bb_std):
+    """
+    Latest RSI, MACD, SMA and Bollinger values from a single sweep of closes.
+
+    Matches the pandas ``calculate_*`` helpers (EWMs with adjust=False, RSI
+    with Wilder smoothing, sample std for the bands) but keeps every
+    accumulator as a scalar instead of materializing full-length Series.
+    Values that need more history than is available are NaN. Smoothing
+    factors are passed in as alphas (see the ALPHA_* constants).
+    """
+    n = closes.shape[0]
+
+    ema_fast = closes[0]
+    ema_slow = closes[0]
+    macd = 0.0
+    macd_signal = 0.0
+    avg_gain = 0.0
+    avg_loss = 0.0
+
+    for i in range(1, n):
+        price = closes[i]
+        ema_fast = a_fast * price + (1.0 - a_fast) * ema_fast
+        ema_slow = a_slow * price + (1.0 - a_slow) * ema_slow
+        macd = ema_fast - ema_slow
+        macd_signal = a_signal * macd + (1.0 - a_signal) * macd_signal
+
+        delta = price - closes[i - 1]
+        gain = delta if delta > 0.0 else 0.0
+        loss = -delta if delta < 0.0 else 0.0
+        avg_gain = a_rsi * gain + (1.0 - a_rsi) * avg_gain
+        avg_loss = a_rsi * loss + (1.0 - a_rsi) * avg_loss
+
+    if avg_loss > 0.0:
+        rsi = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    elif avg_gain > 0.0:
+        rsi = 100.0
+    else:
+        rsi = np.nan
+
+    sma_10 = _sma_last(closes, 10)
+    sma_20 = _sma_last(closes, 20)
+    sma_50 = _sma_last(closes, 50)
+    sma_200 = _sma_last(closes, 200)
+
+    bb_upper = np.nan
+    bb_lower = np.nan
+    if n >= bb_window and bb_window > 1:
+        middle, std = _mean_std_last(closes, bb_window)
+        bb_upper = middle + bb_std * std
+        bb_lower = middle - bb_std * std
+
+    return rsi, macd, macd_signal, sma_10, sma_20, sma_50, sma_200, bb_upper, bb_lower
+
+
+@njit(cache=True)
+def _macd_kernel(prices, a_fast, a_slow, a_signal):
+    """MACD and signal lines with all three EMAs advanced in one loop."""
+    n = prices.shape[0]
+    macd = np.empty(n)
+    signal = np.empty(n)
+    if n == 0:
+        return macd, signal
+
+    ema_fast = prices[0]
+    ema_slow = prices[0]
+    macd[0] = 0.0
+    signal[0] = 0.0
+    for i in range(1, n):
+        ema_fast = a_fast * prices[i] + (1.0 - a_fast) * ema_fast
+        ema_slow = a_slow * prices[i] + (1.0 - a_slow) * ema_slow
+        macd[i] = ema_fast - ema_slow
+        signal[i] = a_signal * macd[i] + (1.0 - a_signal) * signal[i - 1]
+    return macd, signal
+
+
+def _momentum(closes: np.ndarray, lookback: int) -> Optional[float]:
+    """Percent change from ``lookback`` closes ago (inclusive) to the latest."""
+    if closes.size < lookback:
+        return None
+    return float((closes[-1] / closes[-lookback] - 1.0) * 100)
+
+
+def _optional(value: float) -> Optional[float]:
+    """Convert a kernel result to float, mapping NaN to None."""
+    return None if np.isnan(value) else float(value)
+
 
 class StockDataFetcher:
     """Fetches stock data and calculates technical indicators for LangGraph agents."""
 
-    def __init__(self, verbose: bool = False):
+    def __init__(self, verbose: bool = False, cache_dir: Optional[str] = DEFAULT_CACHE_DIR):
+        """
+        Initialize the fetcher.
+
+        Args:
+            verbose: Log fetches and cache hits
+            cache_dir: Directory for the on-disk history, info and indicator
+                cache (None disables it)
+        """
         self.verbose = verbose
         if yf is None:
             raise ImportError("yfinance is required. Install with: pip install yfinance")
 
+        # One yf.Ticker and one history download per symbol, shared by every
+        # getter. History entries are (fetched_at, days, DataFrame).
+        self._ticker_cache: Dict[str, Any] = {}
+        self._hist_cache: Dict[str, Tuple[float, int, pd.DataFrame]] = {}
+        self._symbol_locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        # symbol -> time until which it is treated as invalid
+        self._invalid_symbols: Dict[str, float] = {}
+        self.file_cache = FileCache(cache_dir, ttl_seconds=HISTORY_TTL_SECONDS) if cache_dir else None
+
     def _log(self, msg: str) -> None:
         if self.verbose:
             print(f"[StockData] {msg}")
 
+    def _get_ticker(self, symbol: str):
+        """Return the shared yf.Ticker for a symbol."""
+        ticker = self._ticker_cache.get(symbol)
+        if ticker is None:
+            ticker = self._ticker_cache.setdefault(symbol, yf.Ticker(symbol))
+        return ticker
+
+    def _get_info(self, symbol: str) -> dict:
+        """Return yf.Ticker.info, served from the disk cache when fresh."""
+        if self.file_cache:
+            info = self.file_cache.get("info", symbol, ttl_seconds=INFO_TTL_SECONDS)
+            if info is not None:
+                self._log(f"Loaded cached info for {symbol}")
+                return info
+
+        info = self._get_ticker(symbol).info
+        if self.file_cache and info:
+            self.file_cache.set("info", symbol, info)
+        return info
+
+    def is_known_invalid(self, symbol: str) -> bool:
+        """Whether a symbol is malformed or recently returned no data."""
+        if not SYMBOL_RE.match(symbol):
+            return True
+
+        if time.time() < self._invalid_symbols.get(symbol, 0.0):
+            return True
+        if self.file_cache and self.file_cache.get("invalid", symbol, ttl_seconds=INVALID_SYMBOL_TTL_SECONDS):
+            self._invalid_symbols[symbol] = time.time() + EMPTY_HISTORY_RETRY_SECONDS
+            return True
+        return False
+
+    def _mark_invalid(self, symbol: str, confirmed: bool) -> None:
+        """
+        Skip a symbol for a while. Only ``confirmed`` unknown symbols are
+        remembered for a day and shared through the disk cache.
+        """
+        ttl = INVALID_SYMBOL_TTL_SECONDS if confirmed else EMPTY_HISTORY_RETRY_SECONDS
+        self._invalid_symbols[symbol] = time.time() + ttl
+        if confirmed and self.file_cache:
+            self.file_cache.set("invalid", symbol, True)
+
+    def _download_history(self, symbol: str, start: datetime, end: datetime) -> pd.DataFrame:
+        """Download daily history, marking the symbol invalid if none comes back."""
+        try:
+            hist = self._get_ticker(symbol).history(start=start, end=end, interval="1d")
+        except Exception as e:
+            # Raised (rather than logged) when yfinance is set to surface errors
+            if YFTzMissingError is None or not isinstance(e, YFTzMissingError):
+                raise
+            self._log(f"Unknown symbol {symbol}: {e}")
+            self._mark_invalid(symbol, confirmed=True)
+            return pd.DataFrame()
+
+        if hist.empty:
+            self._mark_invalid(symbol, confirmed=False)
+        return hist
+
+    def _symbol_lock(self, symbol: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._symbol_locks.setdefault(symbol, threading.Lock())
+
+    def _get_history(self, symbol: str, days: int) -> pd.DataFrame:
+        """
+        Return at least ``days`` of daily history, fetching at most once per TTL.
+
+        Concurrent callers for the same symbol wait on a per-symbol lock, so
+        parallel getters share one download instead of racing.
+        """
+        with self._symbol_lock(symbol):
+            cached = self._hist_cache.get(symbol)
+            if cached is not None:
+                fetched_at, cached_days, hist = cached
+                if cached_days >= days and time.time() - fetched_at < HISTORY_TTL_SECONDS:
+                    return hist
+
+            fetch_days = max(days, MIN_HISTORY_DAYS)
+            cache_key = f"{symbol}:{fetch_days}"
+            hist = self.file_cache.get("history", cache_key) if self.file_cache else None
+
+            if hist is None:
+                end_date = datetime.today()
+                start_date = end_date - timedelta(days=fetch_days)
+                hist = self._download_history(symbol, start_date, end_date)
+                self._log(f"Fetched {len(hist)} days of data for {symbol}")
+                self._store_history(symbol, fetch_days, hist)
+            else:
+                self._log(f"Loaded {len(hist)} days of cached data for {symbol}")
+                self._hist_cache[symbol] = (time.time(), fetch_days, hist)
+            return hist
+
+    def _store_history(self, symbol: str, days: int, hist: pd.DataFrame) -> None:
+        """Record a downloaded history in the memory and disk caches."""
+        self._hist_cache[symbol] = (time.time(), days, hist)
+        if self.file_cache and not hist.empty:
+            self.file_cache.set("history", f"{symbol}:{days}", hist)
+
+    def get_historical_data_bulk(
+        self,
+        symbols: List[str],
+        days: int = MIN_HISTORY_DAYS,
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch daily history for many symbols in one yf.download request.
+
+        Results are stored in the history caches, so later per-symbol calls
+        (from this fetcher, or any fetcher sharing the disk cache) skip the
+        network. Symbols Yahoo returns no data for are left out.
+        """
+        fetch_days = max(days, MIN_HISTORY_DAYS)
+        end_date = datetime.today()
+        start_date = end_date - timedelta(days=fetch_days)
+
+        try:
+            data = yf.download(
+                symbols,
+                start=start_date,
+                end=end_date,
+                interval="1d",
+                group_by="ticker",
+                threads=True,
+                progress=False,
+            )
+        except Exception as e:
+            self._log(f"Error batch fetching {symbols}: {e}")
+            return {}
+
+        histories = {}
+        for symbol in symbols:
+            if isinstance(data.columns, pd.MultiIndex):
+                if symbol not in data.columns.get_level_values(0):
+                    continue
+                hist = data[symbol]
+            else:
+                hist = data
+            hist = hist.dropna(how="all")
+            if hist.empty:
+                continue
+
+            with self._symbol_lock(symbol):
+                self._store_history(symbol, fetch_days, hist)
+            histories[symbol] = hist
+
+        self._log(f"Batch fetched history for {len(histories)}/{len(symbols)} symbols")
+        return histories
+
     def get_historical_data(
         self,
         symbol: str,
         days: int = 365,
     ) -> pd.DataFrame:
         """Fetch historical OHLCV data."""
+        if self.is_known_invalid(symbol):
+            self._log(f"Skipping unknown symbol {symbol}")
+            return pd.DataFrame()
+
         try:
-            ticker = yf.Ticker(symbol)
-            end_date = datetime.today()
-            start_date = end_date - timedelta(days=days)
-            hist = ticker.history(start=start_date, end=end_date, interval="1d")
-            self._log(f"Fetched {len(hist)} days of data for {symbol}")
-            return hist
+            return self._trim_history(self._get_history(symbol, days), days)
         except Exception as e:
             self._log(f"Error fetching {symbol}: {e}")
             return pd.DataFrame()
 
+    @staticmethod
+    def _trim_history(hist: pd.DataFrame, days: int) -> pd.DataFrame:
+        """Trim a longer history to the last ``days`` calendar days."""
+        if hist.empty:
+            return hist
+        start = pd.Timestamp((datetime.today() - timedelta(days=days)).date(), tz=hist.index.tz)
+        return hist.loc[hist.index >= start]
+
     def get_company_info(self, symbol: str) -> dict:
         """Get company fundamentals."""
+        if self.is_known_invalid(symbol):
+            return {"symbol": symbol, "error": f"Unknown symbol: {symbol}"}
+
         try:
-            ticker = yf.Ticker(symbol)
-            info = ticker.info
+            info = self._get_info(symbol)
             return {
                 "name": info.get("shortName", symbol),
                 "symbol": symbol,
@@ -66,6 +389,25 @@ class StockDataFetcher:
             self._log(f"Error getting info for {symbol}: {e}")
             return {"symbol": symbol, "error": str(e)}
 
+    @staticmethod
+    def _rolling_reduce(
+        values: np.ndarray,
+        window: int,
+        reducer: Callable[..., np.ndarray],
+    ) -> np.ndarray:
+        """
+        Apply a vectorized reducer to every trailing window of ``values``.
+
+        Use this instead of ``Series.rolling(...).apply(func)``, which calls
+        back into Python once per window. ``reducer`` is called once as
+        ``reducer(windows, axis=1)`` on a strided (copy-free) view. Like
+        pandas rolling, the first ``window - 1`` results are NaN.
+        """
+        result = np.full(values.shape[0], np.nan)
+        if 1 < window <= values.shape[0]:
+            result[window - 1:] = reducer(sliding_window_view(values, window), axis=1)
+        return result
+
     def calculate_sma(self, prices: pd.Series, window: int) -> pd.Series:
         """Calculate Simple Moving Average."""
         return prices.rolling(window=window).mean()
@@ -76,16 +418,19 @@ class StockDataFetcher:
 
     def calculate_rsi(self, prices: pd.Series, period: int = 14) -> pd.Series:
         """Calculate Relative Strength Index."""
-        delta = prices.diff()
-        gain = delta.where(delta > 0, 0)
-        loss = -delta.where(delta < 0, 0)
+        delta = prices.diff().to_numpy(dtype=np.float64)
+        # NaN (first row) compares False, so it becomes 0 like Series.where
+        gains = pd.DataFrame(
+            {"gain": np.where(delta > 0, delta, 0.0), "loss": np.where(delta < 0, -delta, 0.0)},
+            index=prices.index,
+        )
 
-        avg_gain = gain.ewm(alpha=1 / period, adjust=False).mean()
-        avg_loss = loss.ewm(alpha=1 / period, adjust=False).mean()
+        averages = gains.ewm(alpha=1 / period, adjust=False).mean()
 
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
-        return rsi
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rs = averages["gain"].to_numpy() / averages["loss"].to_numpy()
+            rsi = 100 - (100 / (1 + rs))
+        return pd.Series(rsi, index=prices.index)
 
     def calculate_macd(
         self,
@@ -95,10 +440,19 @@ class StockDataFetcher:
         signal: int = 9,
     ) -> Dict[str, pd.Series]:
         """Calculate MACD indicator."""
-        ema_fast = prices.ewm(span=fast, adjust=False).mean()
-        ema_slow = prices.ewm(span=slow, adjust=False).mean()
-        macd_line = ema_fast - ema_slow
-        signal_line = macd_line.ewm(span=signal, adjust=False).mean()
+        values = prices.to_numpy(dtype=np.float64)
+        if np.isnan(values).any():
+            # pandas' NaN handling in ewm isn't reproduced by the kernel
+            ema_fast = prices.ewm(span=fast, adjust=False).mean()
+            ema_slow = prices.ewm(span=slow, adjust=False).mean()
+            macd_line = ema_fast - ema_slow
+            signal_line = macd_line.ewm(span=signal, adjust=False).mean()
+        else:
+            macd_values, signal_values = _macd_kernel(
+                values, 2.0 / (fast + 1), 2.0 / (slow + 1), 2.0 / (signal + 1)
+            )
+            macd_line = pd.Series(macd_values, index=prices.index)
+            signal_line = pd.Series(signal_values, index=prices.index)
         histogram = macd_line - signal_line
 
         return {
@@ -114,8 +468,12 @@ class StockDataFetcher:
         num_std: int = 2,
     ) -> Dict[str, pd.Series]:
         """Calculate Bollinger Bands."""
-        sma = prices.rolling(window=window).mean()
-        std = prices.rolling(window=window).std()
+        values = prices.to_numpy(dtype=np.float64)
+        sma = pd.Series(self._rolling_reduce(values, window, np.mean), index=prices.index)
+        std = pd.Series(
+            self._rolling_reduce(values, window, lambda w, axis: np.std(w, axis=axis, ddof=1)),
+            index=prices.index,
+        )
         upper = sma + (std * num_std)
         lower = sma - (std * num_std)
 
@@ -126,68 +484,141 @@ class StockDataFetcher:
         }
 
     def get_technical_indicators(self, symbol: str, days: int = 365) -> dict:
-        """Get all technical indicators for a symbol."""
-        hist = self.get_historical_data(symbol, days)
-        if hist.empty:
-            return {"error": "No data available"}
+        """
+        Get all technical indicators for a symbol.
 
-        closes = hist["Close"].dropna()
-        latest_price = float(closes.iloc[-1]) if len(closes) > 0 else 0
+        Results are kept in the disk cache for the same TTL as the history
+        they are computed from, so repeated runs (or other processes sharing
+        the cache directory) skip both the history load and the computation.
+        """
+        cache_key = f"{symbol}:{days}"
+        if self.file_cache:
+            indicators = self.file_cache.get("indicators", cache_key)
+            if indicators is not None:
+                return indicators
 
-        # Calculate indicators
-        rsi = self.calculate_rsi(closes)
-        macd = self.calculate_macd(closes)
-        bb = self.calculate_bollinger_bands(closes)
+        indicators = self._compute_indicators(self.get_historical_data(symbol, days))
+        if self.file_cache and "error" not in indicators:
+            self.file_cache.set("indicators", cache_key, indicators)
+        return indicators
 
-        # Get latest values
-        latest_rsi = float(rsi.iloc[-1]) if len(rsi) > 0 and not np.isnan(rsi.iloc[-1]) else None
-        latest_macd = float(macd["macd_line"].iloc[-1]) if len(macd["macd_line"]) > 0 else None
-        latest_signal = float(macd["signal_line"].iloc[-1]) if len(macd["signal_line"]) > 0 else None
+    def _compute_indicators(self, hist: pd.DataFrame) -> dict:
+        """Compute the technical indicator summary from an OHLCV frame."""
+        if hist.empty:
+            return {"error": "No data available"}
+
+        # Drop missing closes once, on the raw array; everything below reuses it
+        closes = hist["Close"].to_numpy(dtype=np.float64)
+        closes = closes[~np.isnan(closes)]
+        if closes.size == 0:
+            return {"error": "No data available"}
+        latest_price = float(closes[-1])
 
-        # Moving averages
-        sma_10 = float(self.calculate_sma(closes, 10).iloc[-1]) if len(closes) >= 10 else None
-        sma_20 = float(self.calculate_sma(closes, 20).iloc[-1]) if len(closes) >= 20 else None
-        sma_50 = float(self.calculate_sma(closes, 50).iloc[-1]) if len(closes) >= 50 else None
-        sma_200 = float(self.calculate_sma(closes, 200).iloc[-1]) if len(closes) >= 200 else None
+        # Every indicator's latest value from one pass over the closes
+        (
+            rsi, macd, macd_signal, sma_10, sma_20, sma_50, sma_200, bb_upper, bb_lower,
+        ) = _indicators_kernel(
+            closes, ALPHA_RSI, ALPHA_FAST, ALPHA_SLOW, ALPHA_SIGNAL, BB_WINDOW, BB_NUM_STD,
+        )
 
         # Momentum
-        momentum_5d = ((closes.iloc[-1] - closes.iloc[-5]) / closes.iloc[-5] * 100) if len(closes) >= 5 else None
-        momentum_20d = ((closes.iloc[-1] - closes.iloc[-20]) / closes.iloc[-20] * 100) if len(closes) >= 20 else None
+        momentum_5d = _momentum(closes, 5)
+        momentum_20d = _momentum(closes, 20)
 
         return {
             "current_price": latest_price,
-            "rsi_14": latest_rsi,
-            "macd": latest_macd,
-            "macd_signal": latest_signal,
-            "sma_10": sma_10,
-            "sma_20": sma_20,
-            "sma_50": sma_50,
-            "sma_200": sma_200,
+            "rsi_14": _optional(rsi),
+            "macd": _optional(macd),
+            "macd_signal": _optional(macd_signal),
+            "sma_10": _optional(sma_10),
+            "sma_20": _optional(sma_20),
+            "sma_50": _optional(sma_50),
+            "sma_200": _optional(sma_200),
             "momentum_5d": momentum_5d,
             "momentum_20d": momentum_20d,
-            "bb_upper": float(bb["upper_band"].iloc[-1]) if not np.isnan(bb["upper_band"].iloc[-1]) else None,
-            "bb_lower": float(bb["lower_band"].iloc[-1]) if not np.isnan(bb["lower_band"].iloc[-1]) else None,
+            "bb_upper": _optional(bb_upper),
+            "bb_lower": _optional(bb_lower),
         }
 
     def get_price_history(self, symbol: str, days: int = 60) -> List[float]:
         """Get list of closing prices for LangGraph technical analyst."""
-        hist = self.get_historical_data(symbol, days)
+        return self._price_list(self.get_historical_data(symbol, days))
+
+    def get_volume_history(self, symbol: str, days: int = 60) -> List[int]:
+        """Get list of volumes for LangGraph technical analyst."""
+        return self._volume_list(self.get_historical_data(symbol, days))
+
+    def get_price_array(self, symbol: str, days: int = 60) -> np.ndarray:
+        """Get closing prices as a contiguous float64 array for numeric code."""
+        return self._extract_prices(self.get_historical_data(symbol, days))
+
+    def get_volume_array(self, symbol: str, days: int = 60) -> np.ndarray:
+        """Get volumes as a contiguous int64 array for numeric code."""
+        return self._extract_volumes(self.get_historical_data(symbol, days))
+
+    @staticmethod
+    def _price_list(hist: pd.DataFrame) -> List[float]:
         if hist.empty:
             return []
         return hist["Close"].dropna().tolist()
 
-    def get_volume_history(self, symbol: str, days: int = 60) -> List[int]:
-        """Get list of volumes for LangGraph technical analyst."""
-        hist = self.get_historical_data(symbol, days)
+    @staticmethod
+    def _volume_list(hist: pd.DataFrame) -> List[int]:
         if hist.empty:
             return []
         return hist["Volume"].dropna().astype(int).tolist()
 
+    @staticmethod
+    def _extract_prices(hist: pd.DataFrame) -> np.ndarray:
+        if hist.empty:
+            return np.empty(0, dtype=np.float64)
+        return np.ascontiguousarray(hist["Close"].dropna().to_numpy(dtype=np.float64))
+
+    @staticmethod
+    def _extract_volumes(hist: pd.DataFrame) -> np.ndarray:
+        if hist.empty:
+            return np.empty(0, dtype=np.int64)
+        return np.ascontiguousarray(hist["Volume"].dropna().to_numpy(dtype=np.int64))
+
     def get_financial_reports(self, symbol: str) -> dict:
         """Get financial report data for LangGraph fundamentals analyst."""
-        info = self.get_company_info(symbol)
-        indicators = self.get_technical_indicators(symbol)
+        return self._build_financial_reports(
+            self.get_company_info(symbol),
+            self.get_technical_indicators(symbol),
+        )
+
+    def analyze_symbol(self, symbol: str, days: int = 365, price_days: int = 60) -> dict:
+        """
+        Everything MarketDataFetcher needs for a symbol, from one history load.
+
+        The history is fetched (or read from cache) once and the indicators,
+        price/volume history and financial reports are all derived from it.
+        Company info is fetched concurrently with the history.
+
+        Returns:
+            {
+                "technical_indicators": dict,
+                "price_history": List[float],
+                "volume_history": List[int],
+                "financial_reports": dict,
+            }
+        """
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            info_future = executor.submit(self.get_company_info, symbol)
+            hist = self.get_historical_data(symbol, max(days, price_days))
+            info = info_future.result()
+
+        indicators = self._compute_indicators(self._trim_history(hist, days))
+        recent = self._trim_history(hist, price_days)
+        return {
+            "technical_indicators": indicators,
+            "price_history": self._price_list(recent),
+            "volume_history": self._volume_list(recent),
+            "financial_reports": self._build_financial_reports(info, indicators),
+        }
 
+    @staticmethod
+    def _build_financial_reports(info: dict, indicators: dict) -> dict:
         return {
             "income_statement": {
                 "market_cap": f"${info.get('market_cap', 0) / 1e9:.2f}B" if info.get('market_cap') else "N/A",
@@ -13,19 +13,31 @@ Usage:
     python main.py AAPL MSFT GOOGL         # Analyze multiple tickers
     python main.py --visualize             # Show workflow graph
     python main.py AAPL --output json      # Output as JSON
+    python main.py AAPL MSFT -o ndjson     # One JSON line per ticker
     python main.py AAPL --verbose          # Verbose logging
 """
 
 import argparse
+import asyncio
+import atexit
+import hashlib
 import json
 import logging
 import os
+import re
 import sys
+import threading
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
-from dotenv import load_dotenv
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from pipeline.state import AnalysisResult
 
 # Configure logging
 logging.basicConfig(
@@ -35,76 +47,19 @@ logging.basicConfig(
 )
 logger = logging.getLogger("TradingAgents")
 
+# Pretty-printed like json.dumps(indent=2); NumPy values and datetimes are
+# encoded natively
+ORJSON_OPTIONS = (
+    orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+) if orjson else 0
+# One compact object per line for --output ndjson
+ORJSON_NDJSON_OPTIONS = (
+    orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+) if orjson else 0
 
-def setup_environment() -> bool:
-    """Load environment variables and validate configuration."""
-    load_dotenv()
-    
-    groq_key = os.getenv("GROQ_API_KEY")
-    if not groq_key:
-        logger.error("GROQ_API_KEY not found in environment")
-        logger.error("Set it in .env file: GROQ_API_KEY=gsk_...")
-        return False
-    
-    if groq_key.startswith("gsk_") and len(groq_key) > 20:
-        logger.info("Groq API key configured ✓")
-        return True
-    
-    logger.warning("GROQ_API_KEY format may be invalid")
-    return True
 
-
-def visualize_graph(save_path: Optional[str] = None, full_pipeline: bool = True) -> None:
-    """
-    Visualize the LangGraph workflow and optionally save to file.
-    
-    Args:
-        save_path: Optional path to save the graph image
-        full_pipeline: If True, show full pipeline; else show analyst team only
-    """
-    try:
-        if full_pipeline:
-            from pipeline import TradingPipeline
-            logger.info("Building full pipeline graph...")
-            pipeline = TradingPipeline()
-            graph = pipeline.graph
-        else:
-            from analysts import AnalystsTeam
-            logger.info("Building analyst team graph...")
-            team = AnalystsTeam()
-            graph = team.graph
-        
-        # Try to use graphviz for visualization
-        try:
-            from IPython.display import Image, display
-            
-            # Generate PNG using mermaid
-            png_data = graph.get_graph().draw_mermaid_png()
-            
-            if save_path:
-                with open(save_path, "wb") as f:
-                    f.write(png_data)
-                logger.info(f"Graph saved to: {save_path}")
-            else:
-                # Save to default location
-                output_path = Path("workflow_graph.png")
-                with open(output_path, "wb") as f:
-                    f.write(png_data)
-                logger.info(f"Graph saved to: {output_path.absolute()}")
-                
-        except ImportError:
-            # Fallback: print ASCII representation
-            logger.info("Graphviz not available, printing ASCII representation:")
-            print_ascii_graph()
-            
-    except Exception as e:
-        logger.error(f"Failed to visualize graph: {e}")
-        print_ascii_graph()
-
-
-def print_ascii_graph() -> None:
-    """Print ASCII representation of the full trading pipeline."""
-    graph_ascii = """
+# ASCII fallback for visualize_graph when the PNG renderer is unavailable
+_ASCII_GRAPH = """
 ╔═══════════════════════════════════════════════════════════════════════════════════════╗
 ║                         TRADING AGENTS - FULL PIPELINE GRAPH                          ║
 ╠═══════════════════════════════════════════════════════════════════════════════════════╣
@@ -122,8 +77,9 @@ def print_ascii_graph() -> None:
 ║  │                            STAGE 2: ANALYST TEAM                                │  ║
 ║  │  ┌────────────┐  ┌──────────────┐  ┌─────────────┐  ┌──────────────┐           │  ║
 ║  │  │    News    │  │ Fundamentals │  │  Sentiment  │  │  Technical   │           │  ║
-║  │  │  Analyst   │─▶│   Analyst    │─▶│   Analyst   │─▶│   Analyst    │           │  ║
-║  │  └────────────┘  └──────────────┘  └─────────────┘  └──────────────┘           │  ║
+║  │  │  Analyst   │  │   Analyst    │  │   Analyst   │  │   Analyst    │           │  ║
+║  │  └─────┬──────┘  └──────┬───────┘  └──────┬──────┘  └──────┬───────┘           │  ║
+║  │        └────────────────┴───────────┬─────┴────────────────┘                    │  ║
 ║  │                                     │                                           │  ║
 ║  │                                     ▼                                           │  ║
 ║  │                          ┌──────────────────┐                                   │  ║
@@ -197,7 +153,323 @@ def print_ascii_graph() -> None:
 ║                                                                                       ║
 ╚═══════════════════════════════════════════════════════════════════════════════════════╝
 """
-    print(graph_ascii)
+
+
+# Fixed parts of the text report, formatted with format_map() so each block
+# renders in one call
+_RULE_70 = "═" * 70
+_THIN_RULE_70 = "─" * 70
+_RULE_80 = "═" * 80
+_THIN_RULE_80 = "─" * 80
+
+_QUICK_HEADER_TMPL = "\n".join([
+    "",
+    _RULE_70,
+    "  TRADING ANALYSIS: {ticker} (Quick Mode)",
+    "  Generated: {timestamp}",
+    _RULE_70,
+    "",
+    "  📊 RECOMMENDATION: {final_signal}",
+    "  📈 Confidence:     {confidence:.1%}",
+    "  💰 Position Size:  {position_size}",
+    "  ⏱️  Time Horizon:   {time_horizon}",
+    "",
+    _THIN_RULE_70,
+    "  REASONING:",
+    _THIN_RULE_70,
+    "  {reasoning}",
+    "",
+])
+
+_FULL_HEADER_TMPL = "\n".join([
+    "",
+    _RULE_80,
+    "  TRADING AGENTS ANALYSIS: {ticker} (Full Pipeline)",
+    "  Generated: {timestamp}",
+    _RULE_80,
+    "",
+    "┌" + "─" * 78 + "┐",
+    "│  📊 FINAL DECISION" + " " * 59 + "│",
+    "├" + "─" * 78 + "┤",
+    "│  Action:         {action:58} │",
+    "│  Confidence:     {confidence:.1%}" + " " * 54 + "│",
+    "│  Position Size:  {position_size:58} │",
+    "│  Time Horizon:   {time_horizon:58} │",
+    "└" + "─" * 78 + "┘",
+    "",
+])
+
+_STRATEGY_TMPL = "\n".join([
+    _THIN_RULE_80,
+    "  📈 TRADING STRATEGY:",
+    _THIN_RULE_80,
+    "  Entry: {entry_strategy}",
+    "  Exit:  {exit_strategy}",
+    "  Risk:  {risk_management}",
+    "",
+])
+
+_REASONING_TMPL = "\n".join([
+    _THIN_RULE_80,
+    "  💭 REASONING:",
+    _THIN_RULE_80,
+    "  {reasoning}",
+    "",
+])
+
+_DISSENT_TMPL = "\n".join([
+    _THIN_RULE_80,
+    "  ⚖️  DISSENTING VIEW:",
+    _THIN_RULE_80,
+    "  {dissenting_view}",
+    "",
+])
+
+_RESEARCH_TMPL = "\n".join([
+    _RULE_80,
+    "  📚 RESEARCHER TEAM DEBATE SUMMARY",
+    _RULE_80,
+    "",
+    "  Investment Thesis: {investment_thesis}",
+    "",
+    "  🐂 BULL CASE:",
+    "     {bull_case_summary}",
+    "",
+    "  🐻 BEAR CASE:",
+    "     {bear_case_summary}",
+    "",
+])
+
+_TRADE_TMPL = "\n".join([
+    "  Action:          {action}",
+    "  Order Type:      {order_type}",
+    "  Position Size:   {position_pct:.1f}% of capital",
+    "  Entry Timing:    {entry_timing}",
+    "  Stop Loss:       {stop_loss_percent}%",
+    "  Take Profit:     {take_profit_percent}%",
+    "  Risk/Reward:     {risk_reward_ratio:.2f}",
+    "",
+])
+
+_SCORE_TMPL = "\n".join([
+    "  📊 DECISION QUALITY SCORE:",
+    "     Overall:    {overall_score:.2f}/1.0",
+    "     Risk:       {risk_score:.2f}",
+    "     Reward:     {reward_score:.2f}",
+    "     Timing:     {timing_score:.2f}",
+    "     Alignment:  {alignment_score:.2f}",
+    "     Iterations: {iterations_used}",
+    "",
+])
+
+_RISK_TMPL = "\n".join([
+    "  Final Action:      {action}",
+    "  Risk Level:        {risk_level}",
+    "  Confidence:        {confidence:.0%}",
+    "  Approved Size:     {approved_pct:.0f}% of requested",
+    "  Required Stop:     {required_stop_loss}%",
+    "  Senior Approval:   {senior_approval}",
+    "",
+])
+
+# Rendered workflow graph images, keyed by a hash of their mermaid source
+_GRAPH_CACHE_DIR = Path(".cache") / "graphs"
+
+# Expected shape of a Groq API key
+_GROQ_KEY_RE = re.compile(r"^gsk_[A-Za-z0-9]{20,}$")
+
+# .env is read once per process; later setup_environment() calls (e.g. from
+# an embedding server) reuse the loaded environment and the validated key.
+_env_loaded = False
+_api_key_checked = False
+
+
+def setup_environment(require_api_key: bool = True) -> bool:
+    """
+    Load environment variables and validate configuration.
+
+    Args:
+        require_api_key: Validate GROQ_API_KEY. Graph-only runs just load .env
+            so the graph's LLM clients can be constructed if a key exists.
+    """
+    global _env_loaded, _api_key_checked
+
+    if not _env_loaded:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        _env_loaded = True
+    if not require_api_key or _api_key_checked:
+        return True
+    
+    groq_key = os.getenv("GROQ_API_KEY")
+    if not groq_key:
+        logger.error("GROQ_API_KEY not found in environment")
+        logger.error("Set it in .env file: GROQ_API_KEY=gsk_...")
+        return False
+    
+    _api_key_checked = True
+    if _GROQ_KEY_RE.match(groq_key):
+        logger.info("Groq API key configured ✓")
+        return True
+    
+    logger.warning("GROQ_API_KEY format may be invalid")
+    return True
+
+
+def visualize_graph(save_path: Optional[str] = None, full_pipeline: bool = True) -> None:
+    """
+    Visualize the LangGraph workflow and optionally save to file.
+    
+    Args:
+        save_path: Optional path to save the graph image
+        full_pipeline: If True, show full pipeline; else show analyst team only
+    """
+    try:
+        if full_pipeline:
+            logger.info("Building full pipeline graph...")
+            graph = _get_pipeline(False).graph
+        else:
+            logger.info("Building analyst team graph...")
+            graph = _get_analysts_team().graph
+        
+        # Try to use graphviz for visualization
+        try:
+            from IPython.display import Image, display
+            
+            png_data = _render_graph_png(graph.get_graph())
+            
+            if save_path:
+                with open(save_path, "wb") as f:
+                    f.write(png_data)
+                logger.info(f"Graph saved to: {save_path}")
+            else:
+                # Save to default location
+                output_path = Path("workflow_graph.png")
+                with open(output_path, "wb") as f:
+                    f.write(png_data)
+                logger.info(f"Graph saved to: {output_path.absolute()}")
+                
+        except ImportError:
+            # Fallback: print ASCII representation
+            logger.info("Graphviz not available, printing ASCII representation:")
+            print_ascii_graph()
+            
+    except Exception as e:
+        logger.error(f"Failed to visualize graph: {e}")
+        print_ascii_graph()
+
+
+def _render_graph_png(drawable) -> bytes:
+    """
+    Render a LangGraph graph to PNG via mermaid, cached by its mermaid source.
+
+    draw_mermaid_png() calls the mermaid.ink web service, so an unchanged
+    graph is served from _GRAPH_CACHE_DIR instead of re-rendered.
+    """
+    source = drawable.draw_mermaid()
+    cache_path = _GRAPH_CACHE_DIR / f"{hashlib.sha1(source.encode('utf-8')).hexdigest()}.png"
+    try:
+        return cache_path.read_bytes()
+    except OSError:
+        pass
+
+    png_data = drawable.draw_mermaid_png()
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_bytes(png_data)
+    except OSError as e:
+        logger.debug(f"Could not cache graph image: {e}")
+    return png_data
+
+
+def print_ascii_graph() -> None:
+    """Print ASCII representation of the full trading pipeline."""
+    print(_ASCII_GRAPH)
+
+
+def prefetch_market_data(
+    tickers: List[str],
+    verbose: bool = False,
+    use_cache: bool = True,
+    max_workers: int = 8,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch market data for all tickers up front, batching the price history.
+
+    History is downloaded with one yfinance request per chunk of tickers
+    instead of one per ticker, and news/company data is fetched
+    concurrently. The results are handed to each analysis so it skips its
+    own fetch.
+    """
+    if len(tickers) < 2:
+        return {}
+
+    try:
+        return _get_market_data_fetcher(verbose, use_cache).fetch_market_data_batch(
+            tickers,
+            news_days=3,
+            news_limit=10,
+            price_days=60,
+            max_workers=max_workers,
+        )
+    except Exception as e:
+        logger.warning(f"Batch market data prefetch failed: {e}")
+        return {}
+
+
+# Progress lines printed by analyze_ticker_async(show_progress=True)
+_STAGE_LABELS = {
+    "fetch_data": "Market data fetched",
+    "analyze": "Analyst team done",
+    "research": "Researcher debate done",
+    "decide": "CIO decision made",
+    "trade": "Trader team done",
+    "risk_manage": "Risk assessment done",
+}
+
+# In-flight analyze_ticker_async() runs, keyed by every argument that
+# affects the result (see analyze_ticker_async())
+_inflight_analyses: Dict[tuple, "asyncio.Task[AnalysisResult]"] = {}
+
+
+# Building a team or pipeline compiles its LangGraph graphs and creates LLM
+# clients. Compiled graphs keep no per-run state (it lives in the state dict
+# passed to invoke), so one instance is shared by every ticker in a run.
+# Event loop reused by the sync wrappers, one per thread. The cached
+# pipelines and teams below keep async HTTP connections bound to the loop
+# they ran on, so starting a fresh loop per call (asyncio.run) breaks them.
+_loop_runners = threading.local()
+
+
+def _run_sync(coro):
+    """Run a coroutine to completion on this thread's reusable event loop."""
+    runner = getattr(_loop_runners, "runner", None)
+    if runner is None:
+        runner = _loop_runners.runner = asyncio.Runner()
+        atexit.register(runner.close)
+    return runner.run(coro)
+
+
+@lru_cache(maxsize=4)
+def _get_pipeline(verbose: bool, use_cache: bool = True, max_parallel: Optional[int] = None):
+    from pipeline import TradingPipeline
+
+    return TradingPipeline(verbose=verbose, use_cache=use_cache, max_parallel=max_parallel)
+
+
+@lru_cache(maxsize=2)
+def _get_analysts_team(max_parallel: Optional[int] = None):
+    from analysts import AnalystsTeam
+
+    return AnalystsTeam(max_concurrency=max_parallel)
+
+
+@lru_cache(maxsize=4)
+def _get_market_data_fetcher(verbose: bool, use_cache: bool = True):
+    from data import MarketDataFetcher
+
+    return MarketDataFetcher(verbose=verbose, use_cache=use_cache)
 
 
 def analyze_ticker(
@@ -205,19 +477,88 @@ def analyze_ticker(
     verbose: bool = False,
     output_format: str = "text",
     quick_mode: bool = False,
-) -> Dict[str, Any]:
+    use_cache: bool = True,
+    market_data: Optional[Dict[str, Any]] = None,
+    max_parallel: Optional[int] = None,
+) -> AnalysisResult:
     """
     Run full analysis on a single ticker.
     
     Args:
         ticker: Stock ticker symbol
         verbose: Enable verbose logging
-        output_format: "text" or "json"
+        output_format: "text", "json" or "ndjson"
         quick_mode: If True, run analyst-only (skip researcher debate)
+        use_cache: Reuse recently fetched market data from the disk cache
+        market_data: Already-fetched market data; skips the fetch
+        max_parallel: Max analyst LLM calls in flight (None = no limit)
         
     Returns:
         Analysis result dictionary
     """
+    return _run_sync(analyze_ticker_async(
+        ticker, verbose, output_format, quick_mode, use_cache,
+        market_data=market_data, max_parallel=max_parallel,
+    ))
+
+
+async def analyze_ticker_async(
+    ticker: str,
+    verbose: bool = False,
+    output_format: str = "text",
+    quick_mode: bool = False,
+    use_cache: bool = True,
+    show_progress: bool = False,
+    market_data: Optional[Dict[str, Any]] = None,
+    max_parallel: Optional[int] = None,
+) -> AnalysisResult:
+    """
+    Async version of analyze_ticker(); see it for the arguments.
+
+    With ``show_progress`` the full pipeline is streamed and a line is
+    printed as each stage completes, instead of staying silent until the
+    whole run finishes.
+
+    Concurrent calls with the same ticker and options on one event loop
+    share a single run (e.g. overlapping requests in a server); later
+    callers get a copy of the first caller's result. Calls that pass their
+    own ``market_data`` are never shared, since it may differ per caller.
+    """
+    run = _analyze_ticker_async(
+        ticker, verbose, output_format, quick_mode, use_cache, show_progress,
+        market_data, max_parallel,
+    )
+    if market_data is not None:
+        return await run
+
+    key = (ticker.upper().strip(), quick_mode, use_cache, max_parallel, show_progress)
+    loop = asyncio.get_running_loop()
+    task = _inflight_analyses.get(key)
+    owner = task is None or task.get_loop() is not loop
+    if not owner:
+        run.close()
+    else:
+        task = loop.create_task(run)
+        _inflight_analyses[key] = task
+        task.add_done_callback(
+            lambda done: _inflight_analyses.pop(key) if _inflight_analyses.get(key) is done else None
+        )
+
+    # Shielded so one cancelled caller doesn't cancel the others' run
+    result = await asyncio.shield(task)
+    return result if owner else dict(result)
+
+
+async def _analyze_ticker_async(
+    ticker: str,
+    verbose: bool,
+    output_format: str,
+    quick_mode: bool,
+    use_cache: bool,
+    show_progress: bool,
+    market_data: Optional[Dict[str, Any]],
+    max_parallel: Optional[int],
+) -> AnalysisResult:
     if verbose:
         logging.getLogger().setLevel(logging.DEBUG)
     
@@ -226,31 +567,31 @@ def analyze_ticker(
     
     if quick_mode:
         # Quick mode: Analyst team only
-        from analysts import AnalystsTeam
-        from data import MarketDataFetcher
-        
-        logger.info("Fetching market data...")
-        fetcher = MarketDataFetcher(verbose=verbose)
-        
-        try:
-            market_data = fetcher.fetch_market_data(
-                ticker=ticker,
-                news_days=3,
-                news_limit=10,
-                price_days=60,
-            )
-        except Exception as e:
-            logger.error(f"Failed to fetch market data: {e}")
-            return {"error": str(e), "ticker": ticker}
+        if market_data is None:
+            logger.info("Fetching market data...")
+            fetcher = _get_market_data_fetcher(verbose, use_cache)
+            
+            try:
+                # yfinance and the scraper are blocking; keep them off the loop
+                market_data = await asyncio.to_thread(
+                    fetcher.fetch_market_data,
+                    ticker=ticker,
+                    news_days=3,
+                    news_limit=10,
+                    price_days=60,
+                )
+            except Exception as e:
+                logger.error(f"Failed to fetch market data: {e}")
+                return {"error": str(e), "ticker": ticker}
         
         logger.info(f"  Price: ${market_data.get('current_price', 0):.2f}")
         logger.info(f"  News articles: {len(market_data.get('news_articles', []))}")
         
         logger.info("Running analyst team...")
-        team = AnalystsTeam()
+        team = _get_analysts_team(max_parallel)
         
         try:
-            result = team.analyze(ticker=ticker, market_data=market_data)
+            result = await team.analyze_async(ticker=ticker, market_data=market_data)
         except Exception as e:
             logger.error(f"Analysis failed: {e}")
             return {"error": str(e), "ticker": ticker}
@@ -262,13 +603,18 @@ def analyze_ticker(
     
     else:
         # Full pipeline: Analysts + Researchers + Final Decision
-        from pipeline import TradingPipeline
-        
         logger.info("Running full trading pipeline...")
-        pipeline = TradingPipeline(verbose=verbose)
+        pipeline = _get_pipeline(verbose, use_cache, max_parallel)
         
         try:
-            result = pipeline.run(ticker=ticker)
+            if show_progress:
+                async for stage, update in pipeline.arun_stream(ticker=ticker, market_data=market_data):
+                    if stage == "result":
+                        result = update
+                    else:
+                        print(f"  ✓ {_STAGE_LABELS.get(stage, stage)}", flush=True)
+            else:
+                result = await pipeline.arun(ticker=ticker, market_data=market_data)
         except Exception as e:
             logger.error(f"Pipeline failed: {e}")
             return {"error": str(e), "ticker": ticker}
@@ -278,7 +624,121 @@ def analyze_ticker(
         return result
 
 
-def format_result_text(result: Dict[str, Any]) -> str:
+async def analyze_tickers(
+    tickers: List[str],
+    verbose: bool = False,
+    output_format: str = "text",
+    quick_mode: bool = False,
+    max_workers: int = 8,
+    use_cache: bool = True,
+    market_data: Optional[Dict[str, Dict[str, Any]]] = None,
+    max_parallel: Optional[int] = None,
+) -> List[AnalysisResult]:
+    """
+    Run analyze_ticker_async() for several tickers concurrently.
+
+    Each ticker's analysis is dominated by network I/O (yfinance, news
+    scraping, LLM calls), so overlapping them cuts wall time from the sum
+    of the per-ticker latencies to roughly the slowest one. At most
+    ``max_workers`` tickers are in flight at once. Results are printed as
+    soon as each ticker completes.
+
+    Duplicate tickers are analyzed (and printed) once; every occurrence
+    gets the result. ``market_data`` maps tickers to prefetched data (see
+    prefetch_market_data()). ``max_parallel`` caps the LLM calls each
+    analysis runs at once, so up to ``max_workers * max_parallel``
+    requests can be in flight overall.
+
+    Returns:
+        Results in the same order as ``tickers``
+    """
+    semaphore = asyncio.Semaphore(max(1, max_workers))
+    results: List[Optional[AnalysisResult]] = [None] * len(tickers)
+
+    # Positions of each distinct ticker in the input
+    positions: Dict[str, List[int]] = {}
+    for index, ticker in enumerate(tickers):
+        positions.setdefault(ticker.upper().strip(), []).append(index)
+
+    # Stage-by-stage progress only makes sense for a single text report;
+    # with several tickers the lines would interleave
+    show_progress = output_format == "text" and len(positions) == 1
+
+    async def analyze(ticker: str):
+        async with semaphore:
+            return ticker, await analyze_ticker_async(
+                ticker, verbose, output_format, quick_mode, use_cache, show_progress,
+                market_data=(market_data or {}).get(ticker),
+                max_parallel=max_parallel,
+            )
+
+    for next_done in asyncio.as_completed([analyze(t) for t in positions]):
+        ticker, result = await next_done
+        first, *duplicates = positions[ticker]
+        results[first] = result
+        for index in duplicates:
+            results[index] = dict(result)
+
+        # Output result
+        if output_format in ("json", "ndjson"):
+            write_result_json(result, compact=output_format == "ndjson")
+        else:
+            print(format_result_text(result))
+
+    return results
+
+
+class _TemplateFields(dict):
+    """format_map() mapping that renders missing keys as N/A."""
+
+    def __missing__(self, key: str) -> str:
+        return "N/A"
+
+
+def _template_fields(result: AnalysisResult) -> _TemplateFields:
+    fields = _TemplateFields(result)
+    fields.setdefault("confidence", 0)
+    return fields
+
+
+def _section_fields(section: Dict[str, Any], **defaults: Any) -> _TemplateFields:
+    """Copy a result section once, filling numeric defaults for the template."""
+    fields = _TemplateFields(defaults)
+    fields.update(section)
+    return fields
+
+
+def format_result_json(result: AnalysisResult, compact: bool = False) -> str:
+    """Format analysis result as JSON (orjson when installed).
+
+    Indented by default; ``compact`` puts the whole object on one line.
+    """
+    if orjson is None:
+        return json.dumps(result, indent=None if compact else 2, default=str)
+    options = ORJSON_NDJSON_OPTIONS if compact else ORJSON_OPTIONS
+    return orjson.dumps(result, option=options, default=str).decode()
+
+
+def write_result_json(result: AnalysisResult, compact: bool = False) -> None:
+    """Print a result as JSON, handing orjson's bytes straight to stdout."""
+    if orjson is None:
+        print(format_result_json(result, compact), flush=True)
+        return
+
+    options = ORJSON_NDJSON_OPTIONS if compact else ORJSON_OPTIONS
+    data = orjson.dumps(result, option=options | orjson.OPT_APPEND_NEWLINE, default=str)
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        # Replaced stdout (e.g. captured in tests) has no byte buffer
+        sys.stdout.write(data.decode())
+        return
+    # Keep ordering with anything already print()ed to the text layer
+    sys.stdout.flush()
+    buffer.write(data)
+    buffer.flush()
+
+
+def format_result_text(result: AnalysisResult) -> str:
     """Format analysis result as readable text."""
     if "error" in result:
         return f"❌ Error analyzing {result.get('ticker', 'unknown')}: {result['error']}"
@@ -291,34 +751,17 @@ def format_result_text(result: Dict[str, Any]) -> str:
         return format_quick_result(result)
 
 
-def format_quick_result(result: Dict[str, Any]) -> str:
+def format_quick_result(result: AnalysisResult) -> str:
     """Format quick (analyst-only) result."""
-    lines = [
-        "",
-        "═" * 70,
-        f"  TRADING ANALYSIS: {result.get('ticker', 'N/A')} (Quick Mode)",
-        f"  Generated: {result.get('timestamp', 'N/A')}",
-        "═" * 70,
-        "",
-        f"  📊 RECOMMENDATION: {result.get('final_signal', 'N/A')}",
-        f"  📈 Confidence:     {result.get('confidence', 0):.1%}",
-        f"  💰 Position Size:  {result.get('position_size', 'N/A')}",
-        f"  ⏱️  Time Horizon:   {result.get('time_horizon', 'N/A')}",
-        "",
-        "─" * 70,
-        "  REASONING:",
-        "─" * 70,
-        f"  {result.get('reasoning', 'N/A')}",
-        "",
-    ]
+    lines = [_QUICK_HEADER_TMPL.format_map(_template_fields(result))]
     
     # Individual analyst signals
     individual = result.get("individual_reports", {})
     if individual:
         lines.extend([
-            "─" * 70,
+            _THIN_RULE_70,
             "  INDIVIDUAL ANALYST SIGNALS:",
-            "─" * 70,
+            _THIN_RULE_70,
         ])
         for name, report in individual.items():
             if report:
@@ -327,90 +770,42 @@ def format_quick_result(result: Dict[str, Any]) -> str:
                 lines.append(f"    {name.upper():15} {sig:6} ({conf:.0%})")
         lines.append("")
     
-    lines.append("═" * 70)
+    lines.append(_RULE_70)
     return "\n".join(lines)
 
 
-def format_full_pipeline_result(result: Dict[str, Any]) -> str:
+def format_full_pipeline_result(result: AnalysisResult) -> str:
     """Format full pipeline result with researcher debate."""
-    lines = [
-        "",
-        "═" * 80,
-        f"  TRADING AGENTS ANALYSIS: {result.get('ticker', 'N/A')} (Full Pipeline)",
-        f"  Generated: {result.get('timestamp', 'N/A')}",
-        "═" * 80,
-        "",
-        "┌" + "─" * 78 + "┐",
-        "│  📊 FINAL DECISION" + " " * 59 + "│",
-        "├" + "─" * 78 + "┤",
-        f"│  Action:         {result.get('action', 'N/A'):58} │",
-        f"│  Confidence:     {result.get('confidence', 0):.1%}{' ' * 54}│",
-        f"│  Position Size:  {result.get('position_size', 'N/A'):58} │",
-        f"│  Time Horizon:   {result.get('time_horizon', 'N/A'):58} │",
-        "└" + "─" * 78 + "┘",
-        "",
-    ]
+    fields = _template_fields(result)
+    lines = [_FULL_HEADER_TMPL.format_map(fields)]
     
     # Entry/Exit Strategy
     if result.get("entry_strategy") or result.get("exit_strategy"):
-        lines.extend([
-            "─" * 80,
-            "  📈 TRADING STRATEGY:",
-            "─" * 80,
-            f"  Entry: {result.get('entry_strategy', 'N/A')}",
-            f"  Exit:  {result.get('exit_strategy', 'N/A')}",
-            f"  Risk:  {result.get('risk_management', 'N/A')}",
-            "",
-        ])
+        lines.append(_STRATEGY_TMPL.format_map(fields))
     
     # Key Catalysts
     catalysts = result.get("key_catalysts", [])
     if catalysts:
         lines.extend([
-            "─" * 80,
+            _THIN_RULE_80,
             "  🎯 KEY CATALYSTS TO WATCH:",
-            "─" * 80,
+            _THIN_RULE_80,
         ])
         for cat in catalysts[:5]:
             lines.append(f"    • {cat}")
         lines.append("")
     
     # Reasoning
-    lines.extend([
-        "─" * 80,
-        "  💭 REASONING:",
-        "─" * 80,
-        f"  {result.get('reasoning', 'N/A')}",
-        "",
-    ])
+    lines.append(_REASONING_TMPL.format_map(fields))
     
     # Dissenting View
     if result.get("dissenting_view"):
-        lines.extend([
-            "─" * 80,
-            "  ⚖️  DISSENTING VIEW:",
-            "─" * 80,
-            f"  {result.get('dissenting_view', 'N/A')}",
-            "",
-        ])
+        lines.append(_DISSENT_TMPL.format_map(fields))
     
     # Research Report Summary
     research = result.get("research_report", {})
     if research and not research.get("error"):
-        lines.extend([
-            "═" * 80,
-            "  📚 RESEARCHER TEAM DEBATE SUMMARY",
-            "═" * 80,
-            "",
-            f"  Investment Thesis: {research.get('investment_thesis', 'N/A')}",
-            "",
-            "  🐂 BULL CASE:",
-            f"     {research.get('bull_case_summary', 'N/A')}",
-            "",
-            "  🐻 BEAR CASE:",
-            f"     {research.get('bear_case_summary', 'N/A')}",
-            "",
-        ])
+        lines.append(_RESEARCH_TMPL.format_map(_section_fields(research)))
         
         # Consensus points
         consensus = research.get("consensus_points", [])
@@ -434,9 +829,9 @@ def format_full_pipeline_result(result: Dict[str, Any]) -> str:
         individual = analyst.get("individual_reports", {})
         if individual:
             lines.extend([
-                "═" * 80,
+                _RULE_80,
                 "  👥 ANALYST TEAM SIGNALS",
-                "═" * 80,
+                _RULE_80,
             ])
             for name, report in individual.items():
                 if report:
@@ -449,34 +844,37 @@ def format_full_pipeline_result(result: Dict[str, Any]) -> str:
     trade_exec = result.get("trade_execution", {})
     if trade_exec and not trade_exec.get("error"):
         lines.extend([
-            "═" * 80,
+            _RULE_80,
             "  💹 TRADE EXECUTION",
-            "═" * 80,
+            _RULE_80,
         ])
         
         trade_decision = trade_exec.get("trade_decision", {})
         final_score = trade_exec.get("final_score", {})
         executed_orders = trade_exec.get("executed_orders", [])
         
-        lines.append(f"  Action:          {trade_decision.get('action', 'N/A')}")
-        lines.append(f"  Order Type:      {trade_decision.get('order_type', 'N/A')}")
-        lines.append(f"  Position Size:   {trade_decision.get('quantity_percent', 0)*100:.1f}% of capital")
-        lines.append(f"  Entry Timing:    {trade_decision.get('entry_timing', 'N/A')}")
-        lines.append(f"  Stop Loss:       {trade_decision.get('stop_loss_percent', 0)}%")
-        lines.append(f"  Take Profit:     {trade_decision.get('take_profit_percent', 0)}%")
-        lines.append(f"  Risk/Reward:     {trade_decision.get('risk_reward_ratio', 0):.2f}")
-        lines.append("")
+        trade_fields = _section_fields(
+            trade_decision,
+            quantity_percent=0,
+            stop_loss_percent=0,
+            take_profit_percent=0,
+            risk_reward_ratio=0,
+        )
+        trade_fields["position_pct"] = trade_fields["quantity_percent"] * 100
+        lines.append(_TRADE_TMPL.format_map(trade_fields))
         
         # Scoring
         if final_score:
-            lines.append("  📊 DECISION QUALITY SCORE:")
-            lines.append(f"     Overall:    {final_score.get('overall_score', 0):.2f}/1.0")
-            lines.append(f"     Risk:       {final_score.get('risk_score', 0):.2f}")
-            lines.append(f"     Reward:     {final_score.get('reward_score', 0):.2f}")
-            lines.append(f"     Timing:     {final_score.get('timing_score', 0):.2f}")
-            lines.append(f"     Alignment:  {final_score.get('alignment_score', 0):.2f}")
-            lines.append(f"     Iterations: {trade_exec.get('iterations_used', 1)}")
-            lines.append("")
+            score_fields = _section_fields(
+                final_score,
+                overall_score=0,
+                risk_score=0,
+                reward_score=0,
+                timing_score=0,
+                alignment_score=0,
+            )
+            score_fields["iterations_used"] = trade_exec.get("iterations_used", 1)
+            lines.append(_SCORE_TMPL.format_map(score_fields))
         
         # Execution status
         exec_status = trade_exec.get("execution_status", "N/A")
@@ -502,18 +900,22 @@ def format_full_pipeline_result(result: Dict[str, Any]) -> str:
         advisors = risk_assessment.get("advisor_assessments", {})
         
         lines.extend([
-            "═" * 80,
+            _RULE_80,
             "  🛡️ RISK MANAGEMENT ASSESSMENT",
-            "═" * 80,
+            _RULE_80,
         ])
         
-        lines.append(f"  Final Action:      {final_rec.get('action', 'N/A')}")
-        lines.append(f"  Risk Level:        {final_rec.get('risk_level', 'N/A')}")
-        lines.append(f"  Confidence:        {final_rec.get('confidence', 0):.0%}")
-        lines.append(f"  Approved Size:     {final_rec.get('approved_position_size', 0)*100:.0f}% of requested")
-        lines.append(f"  Required Stop:     {final_rec.get('required_stop_loss', 0)}%")
-        lines.append(f"  Senior Approval:   {'Required' if final_rec.get('requires_senior_approval') else 'Not Required'}")
-        lines.append("")
+        risk_fields = _section_fields(
+            final_rec,
+            confidence=0,
+            approved_position_size=0,
+            required_stop_loss=0,
+        )
+        risk_fields["approved_pct"] = risk_fields["approved_position_size"] * 100
+        risk_fields["senior_approval"] = (
+            "Required" if final_rec.get("requires_senior_approval") else "Not Required"
+        )
+        lines.append(_RISK_TMPL.format_map(risk_fields))
         
         # Advisor perspectives
         lines.append("  📊 ADVISOR PERSPECTIVES:")
@@ -549,7 +951,7 @@ def format_full_pipeline_result(result: Dict[str, Any]) -> str:
                 lines.append(f"     • {condition}")
             lines.append("")
     
-    lines.append("═" * 80)
+    lines.append(_RULE_80)
     return "\n".join(lines)
 
 
@@ -565,7 +967,10 @@ Examples:
   python main.py AAPL MSFT GOOGL         Analyze multiple stocks
   python main.py --visualize             Show workflow graph
   python main.py AAPL --output json      Output as JSON
+  python main.py AAPL MSFT -o ndjson     One JSON line per stock, as each finishes
   python main.py AAPL -v                 Verbose mode
+  python main.py AAPL MSFT -j 2          Analyze at most 2 stocks at a time
+  python main.py AAPL --max-parallel 2   At most 2 analyst LLM calls at once
 
 Environment:
   GROQ_API_KEY    Required. Get from https://console.groq.com/keys
@@ -584,9 +989,9 @@ Environment:
     )
     parser.add_argument(
         "--output", "-o",
-        choices=["text", "json"],
+        choices=["text", "json", "ndjson"],
         default="text",
-        help="Output format (default: text)",
+        help="Output format (default: text); ndjson writes one line per ticker",
     )
     parser.add_argument(
         "--verbose", "-v",
@@ -604,53 +1009,76 @@ Environment:
         action="store_true",
         help="Quick mode: run analyst team only (skip researcher debate)",
     )
+    parser.add_argument(
+        "--threads", "-j",
+        type=int,
+        default=8,
+        metavar="N",
+        help="Max tickers analyzed concurrently (default: 8)",
+    )
+    parser.add_argument(
+        "--max-parallel",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Max analyst LLM calls in flight per ticker (default: no limit); "
+             "lower it if you hit Groq rate limits",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Fetch fresh market data instead of reusing cached results",
+    )
     
     args = parser.parse_args()
+    visualize = args.visualize or args.save_graph
+    
+    # Require tickers for analysis (checked before any environment setup)
+    if not args.tickers and not visualize:
+        parser.print_help()
+        print("\n❌ Error: No tickers provided. Use --visualize to see the graph.")
+        return 1
     
-    # Setup environment
-    if not setup_environment():
+    # Setup environment; the API key is only validated when analyzing
+    if not setup_environment(require_api_key=bool(args.tickers)):
         return 1
     
     # Handle visualization
-    if args.visualize or args.save_graph:
+    if visualize:
         visualize_graph(args.save_graph)
         if not args.tickers:
             return 0
     
-    # Require tickers for analysis
-    if not args.tickers:
-        parser.print_help()
-        print("\n❌ Error: No tickers provided. Use --visualize to see the graph.")
-        return 1
-    
-    # Analyze each ticker
-    results = []
-    for ticker in args.tickers:
-        ticker = ticker.strip().upper()
-        result = analyze_ticker(
-            ticker=ticker,
-            verbose=args.verbose,
-            output_format=args.output,
-            quick_mode=args.quick,
-        )
-        results.append(result)
-        
-        # Output result
-        if args.output == "json":
-            print(json.dumps(result, indent=2, default=str))
-        else:
-            print(format_result_text(result))
+    tickers = [ticker.strip().upper() for ticker in args.tickers]
+    market_data = prefetch_market_data(
+        tickers,
+        verbose=args.verbose,
+        use_cache=not args.no_cache,
+        max_workers=args.threads,
+    )
+
+    # Analyze all tickers concurrently, printing each result as it finishes
+    results = _run_sync(analyze_tickers(
+        tickers,
+        verbose=args.verbose,
+        output_format=args.output,
+        quick_mode=args.quick,
+        max_workers=args.threads,
+        use_cache=not args.no_cache,
+        market_data=market_data,
+        max_parallel=args.max_parallel,
+    ))
     
     # Summary for multiple tickers
     if len(results) > 1 and args.output == "text":
-        print("\n" + "═" * 80)
+        print("\n" + _RULE_80)
         print("  PORTFOLIO SUMMARY")
-        print("═" * 80)
+        print(_RULE_80)
         for r in results:
             if "error" not in r:
                 action = r.get('action') or r.get('final_signal', 'N/A')
                 print(f"  {r.get('ticker', 'N/A'):8} {action:12} ({r.get('confidence', 0):.0%})")
-        print("═" * 80)
+        print(_RULE_80)
     
     return 0
 
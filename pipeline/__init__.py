@@ -4,6 +4,26 @@ Integrates Analysts Team and Researcher Team into a unified
 trading decision pipeline using LangGraph.
 """
 
-from .trading_pipeline import TradingPipeline
+from typing import TYPE_CHECKING
 
-__all__ = ["TradingPipeline"]
+from .state import AnalysisResult, RiskAssessmentResult, TradeExecutionResult
+
+if TYPE_CHECKING:
+    from .trading_pipeline import TradingPipeline
+
+__all__ = [
+    "TradingPipeline",
+    "AnalysisResult",
+    "TradeExecutionResult",
+    "RiskAssessmentResult",
+]
+
+
+def __getattr__(name: str):
+    # Importing TradingPipeline pulls in LangGraph, LangChain and every agent
+    # team, so defer it until the class is first used (PEP 562)
+    if name == "TradingPipeline":
+        from .trading_pipeline import TradingPipeline
+
+        return TradingPipeline
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
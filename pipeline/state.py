@@ -0,0 +1,69 @@
+"""Result type definitions for the Trading Pipeline.
+
+Defines TypedDicts describing the dicts returned by TradingPipeline.run()
+and consumed by the CLI formatters. They are plain dicts at runtime, so
+they stay JSON-serializable and cost nothing over the untyped version.
+"""
+
+from typing import Dict, List, Optional, TypedDict
+
+
+class TradeExecutionResult(TypedDict, total=False):
+    """Trader Team output (TraderTeam.execute_trade)."""
+
+    ticker: str
+    trade_decision: Optional[dict]
+    final_score: Optional[dict]
+    score_history: List[dict]
+    iterations_used: int
+    portfolio_impact: Optional[dict]
+    executed_orders: List[dict]
+    pending_orders: List[dict]
+    execution_status: Optional[str]
+    human_approved: Optional[bool]
+    human_feedback: Optional[str]
+    error: str
+
+
+class RiskAssessmentResult(TypedDict, total=False):
+    """Risk Management Team output (RiskManagementTeam.assess_risk)."""
+
+    ticker: str
+    final_recommendation: Optional[dict]
+    advisor_assessments: Dict[str, Optional[dict]]
+    trader_feedback: Optional[dict]
+    position_adjustments: Optional[dict]
+    error: str
+
+
+class AnalysisResult(TypedDict, total=False):
+    """Result of one ticker analysis, as printed by main.py."""
+
+    # Final (CIO) decision
+    ticker: str
+    action: str
+    confidence: float
+    position_size: str
+    time_horizon: str
+    entry_strategy: str
+    exit_strategy: str
+    risk_management: str
+    key_catalysts: List[str]
+    reasoning: str
+    dissenting_view: str
+    analyst_report: dict
+    research_report: dict
+
+    # Quick mode (analyst team only)
+    final_signal: str
+
+    # Downstream stages
+    trade_execution: TradeExecutionResult
+    risk_assessment: RiskAssessmentResult
+    pipeline_stage: Optional[str]
+    errors: List[str]
+
+    # Added by the CLI
+    timestamp: str
+    mode: str
+    error: str
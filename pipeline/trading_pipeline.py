@@ -7,18 +7,22 @@ Uses LangGraph for workflow management with proper state transitions,
 feedback-driven reasoning, human-in-the-loop approval, and risk oversight.
 """
 
-from typing import TypedDict, Optional, List, Literal
+import asyncio
+from typing import AsyncIterator, TypedDict, Optional, List, Literal, Tuple
 from langgraph.graph import StateGraph, END
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
+from langchain_core.runnables import RunnableLambda
 from langchain_groq import ChatGroq
 
-from analysts import AnalystsTeam
+from analysts import AnalystsTeam, get_default_llm
 from researchers import ResearcherTeam
 from traders import TraderTeam
 from risk_management import RiskManagementTeam
 from data import MarketDataFetcher
 
+from .state import AnalysisResult
+
 
 class PipelineState(TypedDict):
     """State for the complete trading pipeline."""
@@ -131,14 +135,17 @@ class TradingPipeline:
         score_threshold: float = 0.6,
         require_human_approval: bool = True,
         verbose: bool = False,
+        use_cache: bool = True,
+        max_parallel: Optional[int] = None,
     ):
-        self.llm = llm or ChatGroq(model="llama-3.3-70b-versatile", temperature=0.1)
+        self.llm = llm or get_default_llm()
         self.verbose = verbose
         self.require_human_approval = require_human_approval
         
         # Initialize teams
-        self.data_fetcher = MarketDataFetcher(verbose=verbose)
-        self.analyst_team = AnalystsTeam(llm=self.llm)
+        self.data_fetcher = MarketDataFetcher(verbose=verbose, use_cache=use_cache)
+        # max_parallel caps the analyst fan-out (LLM calls in flight per run)
+        self.analyst_team = AnalystsTeam(llm=self.llm, max_concurrency=max_parallel)
         self.researcher_team = ResearcherTeam(llm=self.llm, max_debate_rounds=max_debate_rounds)
         self.trader_team = TraderTeam(
             llm=self.llm,
@@ -161,10 +168,12 @@ class TradingPipeline:
         workflow = StateGraph(PipelineState)
 
         # Add nodes for each stage
-        workflow.add_node("fetch_data", self._fetch_data_node)
-        workflow.add_node("analyze", self._analyze_node)
+        # I/O-bound stages also have async implementations so ainvoke()
+        # awaits them instead of parking a worker thread on each
+        workflow.add_node("fetch_data", RunnableLambda(self._fetch_data_node, afunc=self._afetch_data_node))
+        workflow.add_node("analyze", RunnableLambda(self._analyze_node, afunc=self._aanalyze_node))
         workflow.add_node("research", self._research_node)
-        workflow.add_node("decide", self._decide_node)
+        workflow.add_node("decide", RunnableLambda(self._decide_node, afunc=self._adecide_node))
         workflow.add_node("trade", self._trade_node)
         workflow.add_node("risk_manage", self._risk_manage_node)
 
@@ -211,6 +220,9 @@ class TradingPipeline:
     def _fetch_data_node(self, state: PipelineState) -> dict:
         """Fetch market data for the ticker."""
         ticker = state["ticker"]
+        if state.get("market_data"):
+            # Supplied by the caller (e.g. from a batch fetch)
+            return self._fetch_success(state["market_data"])
         
         if self.verbose:
             print(f"[Pipeline] Fetching data for {ticker}...")
@@ -222,19 +234,47 @@ class TradingPipeline:
                 news_limit=10,
                 price_days=60,
             )
-            
-            return {
-                "market_data": market_data,
-                "data_fetch_status": "success",
-                "pipeline_stage": "data_fetched",
-            }
         except Exception as e:
-            return {
-                "market_data": {},
-                "data_fetch_status": "error",
-                "errors": state.get("errors", []) + [f"Data fetch failed: {str(e)}"],
-                "pipeline_stage": "data_error",
-            }
+            return self._fetch_error(state, e)
+        return self._fetch_success(market_data)
+
+    async def _afetch_data_node(self, state: PipelineState) -> dict:
+        """Async version of _fetch_data_node (the fetchers are blocking)."""
+        ticker = state["ticker"]
+        if state.get("market_data"):
+            return self._fetch_success(state["market_data"])
+        
+        if self.verbose:
+            print(f"[Pipeline] Fetching data for {ticker}...")
+        
+        try:
+            market_data = await asyncio.to_thread(
+                self.data_fetcher.fetch_market_data,
+                ticker=ticker,
+                news_days=3,
+                news_limit=10,
+                price_days=60,
+            )
+        except Exception as e:
+            return self._fetch_error(state, e)
+        return self._fetch_success(market_data)
+
+    @staticmethod
+    def _fetch_success(market_data: dict) -> dict:
+        return {
+            "market_data": market_data,
+            "data_fetch_status": "success",
+            "pipeline_stage": "data_fetched",
+        }
+
+    @staticmethod
+    def _fetch_error(state: PipelineState, e: Exception) -> dict:
+        return {
+            "market_data": {},
+            "data_fetch_status": "error",
+            "errors": state.get("errors", []) + [f"Data fetch failed: {str(e)}"],
+            "pipeline_stage": "data_error",
+        }
 
     def _analyze_node(self, state: PipelineState) -> dict:
         """Run analyst team analysis."""
@@ -249,19 +289,43 @@ class TradingPipeline:
                 ticker=ticker,
                 market_data=market_data,
             )
-            
-            return {
-                "analyst_report": analyst_report,
-                "analyst_status": "success",
-                "pipeline_stage": "analyzed",
-            }
         except Exception as e:
-            return {
-                "analyst_report": {"error": str(e)},
-                "analyst_status": "error",
-                "errors": state.get("errors", []) + [f"Analysis failed: {str(e)}"],
-                "pipeline_stage": "analysis_error",
-            }
+            return self._analysis_error(state, e)
+        return self._analysis_success(analyst_report)
+
+    async def _aanalyze_node(self, state: PipelineState) -> dict:
+        """Async version of _analyze_node."""
+        ticker = state["ticker"]
+        market_data = state.get("market_data", {})
+        
+        if self.verbose:
+            print(f"[Pipeline] Running analyst team for {ticker}...")
+        
+        try:
+            analyst_report = await self.analyst_team.analyze_async(
+                ticker=ticker,
+                market_data=market_data,
+            )
+        except Exception as e:
+            return self._analysis_error(state, e)
+        return self._analysis_success(analyst_report)
+
+    @staticmethod
+    def _analysis_success(analyst_report: dict) -> dict:
+        return {
+            "analyst_report": analyst_report,
+            "analyst_status": "success",
+            "pipeline_stage": "analyzed",
+        }
+
+    @staticmethod
+    def _analysis_error(state: PipelineState, e: Exception) -> dict:
+        return {
+            "analyst_report": {"error": str(e)},
+            "analyst_status": "error",
+            "errors": state.get("errors", []) + [f"Analysis failed: {str(e)}"],
+            "pipeline_stage": "analysis_error",
+        }
 
     def _research_node(self, state: PipelineState) -> dict:
         """Run researcher team debate."""
@@ -294,35 +358,55 @@ class TradingPipeline:
 
     def _decide_node(self, state: PipelineState) -> dict:
         """Make final trading decision."""
-        ticker = state["ticker"]
-        analyst_report = state.get("analyst_report", {})
-        research_report = state.get("research_report", {})
+        if self.verbose:
+            print(f"[Pipeline] Making final decision for {state['ticker']}...")
         
+        try:
+            chain = self.decision_prompt | self.llm | self.parser
+            result = chain.invoke(self._decision_inputs(state))
+        except Exception as e:
+            return self._decision_error(state, e)
+        return self._decision_success(state, result)
+
+    async def _adecide_node(self, state: PipelineState) -> dict:
+        """Async version of _decide_node."""
         if self.verbose:
-            print(f"[Pipeline] Making final decision for {ticker}...")
+            print(f"[Pipeline] Making final decision for {state['ticker']}...")
         
         try:
             chain = self.decision_prompt | self.llm | self.parser
-            
-            result = chain.invoke({
-                "ticker": ticker,
-                "analyst_signal": analyst_report.get("final_signal", "N/A"),
-                "analyst_confidence": f"{analyst_report.get('confidence', 0):.0%}",
-                "analyst_reasoning": analyst_report.get("reasoning", "N/A"),
-                "research_thesis": research_report.get("investment_thesis", "N/A"),
-                "bull_case": research_report.get("bull_case_summary", "N/A"),
-                "bear_case": research_report.get("bear_case_summary", "N/A"),
-                "risk_reward": research_report.get("risk_reward_assessment", "N/A"),
-                "research_action": research_report.get("recommended_action", "N/A"),
-                "research_conviction": research_report.get("position_conviction", "N/A"),
-                "key_risks": ", ".join(research_report.get("key_risks", [])[:5]),
-                "key_opportunities": ", ".join(research_report.get("key_opportunities", [])[:5]),
-                "consensus_points": ", ".join(research_report.get("consensus_points", [])[:3]),
-                "disagreements": ", ".join(research_report.get("key_disagreements", [])[:3]),
-            })
-            
+            result = await chain.ainvoke(self._decision_inputs(state))
+        except Exception as e:
+            return self._decision_error(state, e)
+        return self._decision_success(state, result)
+
+    @staticmethod
+    def _decision_inputs(state: PipelineState) -> dict:
+        """Prompt variables for the CIO decision."""
+        analyst_report = state.get("analyst_report", {})
+        research_report = state.get("research_report", {})
+        return {
+            "ticker": state["ticker"],
+            "analyst_signal": analyst_report.get("final_signal", "N/A"),
+            "analyst_confidence": f"{analyst_report.get('confidence', 0):.0%}",
+            "analyst_reasoning": analyst_report.get("reasoning", "N/A"),
+            "research_thesis": research_report.get("investment_thesis", "N/A"),
+            "bull_case": research_report.get("bull_case_summary", "N/A"),
+            "bear_case": research_report.get("bear_case_summary", "N/A"),
+            "risk_reward": research_report.get("risk_reward_assessment", "N/A"),
+            "research_action": research_report.get("recommended_action", "N/A"),
+            "research_conviction": research_report.get("position_conviction", "N/A"),
+            "key_risks": ", ".join(research_report.get("key_risks", [])[:5]),
+            "key_opportunities": ", ".join(research_report.get("key_opportunities", [])[:5]),
+            "consensus_points": ", ".join(research_report.get("consensus_points", [])[:3]),
+            "disagreements": ", ".join(research_report.get("key_disagreements", [])[:3]),
+        }
+
+    @staticmethod
+    def _decision_success(state: PipelineState, result: dict) -> dict:
+        try:
             final_decision = {
-                "ticker": ticker,
+                "ticker": state["ticker"],
                 "action": result.get("final_action", "HOLD"),
                 "confidence": float(result.get("confidence", 0.5)),
                 "position_size": result.get("position_size", "NONE"),
@@ -333,28 +417,31 @@ class TradingPipeline:
                 "key_catalysts": result.get("key_catalysts", []),
                 "reasoning": result.get("reasoning", ""),
                 "dissenting_view": result.get("dissenting_view", ""),
-                "analyst_report": analyst_report,
-                "research_report": research_report,
+                "analyst_report": state.get("analyst_report", {}),
+                "research_report": state.get("research_report", {}),
             }
-            
-            return {
-                "final_decision": final_decision,
-                "pipeline_stage": "complete",
-            }
-            
         except Exception as e:
-            return {
-                "final_decision": {
-                    "ticker": ticker,
-                    "action": "HOLD",
-                    "confidence": 0.0,
-                    "reasoning": f"Decision failed: {str(e)}",
-                    "analyst_report": analyst_report,
-                    "research_report": research_report,
-                },
-                "pipeline_stage": "decision_error",
-                "errors": state.get("errors", []) + [f"Decision failed: {str(e)}"],
-            }
+            return TradingPipeline._decision_error(state, e)
+        
+        return {
+            "final_decision": final_decision,
+            "pipeline_stage": "complete",
+        }
+
+    @staticmethod
+    def _decision_error(state: PipelineState, e: Exception) -> dict:
+        return {
+            "final_decision": {
+                "ticker": state["ticker"],
+                "action": "HOLD",
+                "confidence": 0.0,
+                "reasoning": f"Decision failed: {str(e)}",
+                "analyst_report": state.get("analyst_report", {}),
+                "research_report": state.get("research_report", {}),
+            },
+            "pipeline_stage": "decision_error",
+            "errors": state.get("errors", []) + [f"Decision failed: {str(e)}"],
+        }
 
     def _trade_node(self, state: PipelineState) -> dict:
         """Execute trading workflow with feedback loop."""
@@ -445,35 +532,23 @@ class TradingPipeline:
         
         return "execute"
 
-    def run(
+    def _initial_state(
         self,
         ticker: str,
-        available_capital: float = 100000.0,
-        risk_tolerance: str = "moderate",
-        portfolio: list = None,
-        enable_trading: bool = True,
-    ) -> dict:
-        """
-        Run the complete trading pipeline for a ticker.
-        
-        Args:
-            ticker: Stock ticker symbol (e.g., "AAPL")
-            available_capital: Capital available for trading
-            risk_tolerance: "conservative", "moderate", or "aggressive"
-            portfolio: Current portfolio positions
-            enable_trading: Whether to execute trades
-            
-        Returns:
-            Complete trading decision with execution results
-        """
-        initial_state: PipelineState = {
+        available_capital: float,
+        risk_tolerance: str,
+        portfolio: Optional[list],
+        enable_trading: bool,
+        market_data: Optional[dict] = None,
+    ) -> PipelineState:
+        return {
             "ticker": ticker.upper().strip(),
             "available_capital": available_capital,
             "risk_tolerance": risk_tolerance,
             "portfolio": portfolio or [],
             "enable_trading": enable_trading,
             "require_human_approval": self.require_human_approval,
-            "market_data": None,
+            "market_data": market_data,
             "data_fetch_status": "pending",
             "analyst_report": None,
             "analyst_status": "pending",
@@ -489,12 +564,13 @@ class TradingPipeline:
             "messages": [],
         }
 
-        result = self.graph.invoke(initial_state)
-        
-        # Build comprehensive result
-        final_decision = result.get("final_decision", {})
-        trade_execution = result.get("trade_execution", {})
-        risk_assessment = result.get("risk_assessment", {})
+    @staticmethod
+    def _build_result(result: dict) -> AnalysisResult:
+        """Flatten the final pipeline state into the run() result."""
+        # Stages that never ran are None in the state (e.g. after a failed fetch)
+        final_decision = result.get("final_decision") or {}
+        trade_execution = result.get("trade_execution") or {}
+        risk_assessment = result.get("risk_assessment") or {}
         
         return {
             **final_decision,
@@ -504,6 +580,82 @@ class TradingPipeline:
             "errors": result.get("errors", []),
         }
 
+    def run(
+        self,
+        ticker: str,
+        available_capital: float = 100000.0,
+        risk_tolerance: str = "moderate",
+        portfolio: list = None,
+        enable_trading: bool = True,
+        market_data: Optional[dict] = None,
+    ) -> AnalysisResult:
+        """
+        Run the complete trading pipeline for a ticker.
+        
+        Args:
+            ticker: Stock ticker symbol (e.g., "AAPL")
+            available_capital: Capital available for trading
+            risk_tolerance: "conservative", "moderate", or "aggressive"
+            portfolio: Current portfolio positions
+            enable_trading: Whether to execute trades
+            market_data: Already-fetched market data (skips the fetch stage)
+            
+        Returns:
+            Complete trading decision with execution results
+        """
+        initial_state = self._initial_state(
+            ticker, available_capital, risk_tolerance, portfolio, enable_trading, market_data
+        )
+        return self._build_result(self.graph.invoke(initial_state))
+
+    async def arun(
+        self,
+        ticker: str,
+        available_capital: float = 100000.0,
+        risk_tolerance: str = "moderate",
+        portfolio: list = None,
+        enable_trading: bool = True,
+        market_data: Optional[dict] = None,
+    ) -> AnalysisResult:
+        """
+        Async version of run().
+
+        Data fetching, analysis and the CIO decision are awaited natively;
+        the remaining stages run in LangGraph's executor. Several tickers can
+        be analyzed concurrently with asyncio.gather(*[pipeline.arun(t) ...]).
+        """
+        initial_state = self._initial_state(
+            ticker, available_capital, risk_tolerance, portfolio, enable_trading, market_data
+        )
+        return self._build_result(await self.graph.ainvoke(initial_state))
+
+    async def arun_stream(
+        self,
+        ticker: str,
+        available_capital: float = 100000.0,
+        risk_tolerance: str = "moderate",
+        portfolio: list = None,
+        enable_trading: bool = True,
+        market_data: Optional[dict] = None,
+    ) -> AsyncIterator[Tuple[str, dict]]:
+        """
+        Run the pipeline, yielding progress as each stage finishes.
+
+        Yields ``(node_name, state_update)`` for every completed stage
+        ("fetch_data", "analyze", "research", "decide", "trade",
+        "risk_manage"), then a final ``("result", result)`` where result is
+        what run() would have returned.
+        """
+        initial_state = self._initial_state(
+            ticker, available_capital, risk_tolerance, portfolio, enable_trading, market_data
+        )
+        state = dict(initial_state)
+        async for chunk in self.graph.astream(initial_state, stream_mode="updates"):
+            for node, update in chunk.items():
+                state.update(update or {})
+                yield node, update
+        yield "result", self._build_result(state)
+
     def run_with_details(
         self,
         ticker: str,
@@ -513,29 +665,9 @@ class TradingPipeline:
         enable_trading: bool = True,
     ) -> dict:
         """Run pipeline and return full state including intermediate results."""
-        initial_state: PipelineState = {
-            "ticker": ticker.upper().strip(),
-            "available_capital": available_capital,
-            "risk_tolerance": risk_tolerance,
-            "portfolio": portfolio or [],
-            "enable_trading": enable_trading,
-            "require_human_approval": self.require_human_approval,
-            "market_data": None,
-            "data_fetch_status": "pending",
-            "analyst_report": None,
-            "analyst_status": "pending",
-            "research_report": None,
-            "research_status": "pending",
-            "final_decision": None,
-            "trade_execution": None,
-            "trader_status": "pending",
-            "risk_assessment": None,
-            "risk_status": "pending",
-            "pipeline_stage": "initialized",
-            "errors": [],
-            "messages": [],
-        }
-
+        initial_state = self._initial_state(
+            ticker, available_capital, risk_tolerance, portfolio, enable_trading
+        )
         result = self.graph.invoke(initial_state)
         
         return {
@@ -0,0 +1,100 @@
+"""Regression check: shared LLM clients must survive successive event loops.
+
+Every sync wrapper (AnalystsTeam.analyze_many, main.analyze_ticker) starts a
+new loop with asyncio.run(), while get_default_llm() and main's cached teams
+are reused across calls. A local stand-in for the Groq API serves the calls.
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+REPORT = json.dumps({"signal": "BUY", "confidence": 0.8, "reasoning": "ok", "key_factors": ["a"]})
+
+MARKET_DATA = {
+    "current_price": 10.0,
+    "price_history": [float(i % 7 + 10) for i in range(60)],
+    "volume_history": list(range(60)),
+    "news_articles": ["Headline\nBody"] * 3,
+    "financial_reports": {"revenue": 1},
+}
+
+
+class FakeGroqHandler(BaseHTTPRequestHandler):
+    """Answers every chat completion (streamed or not) with REPORT."""
+
+    protocol_version = "HTTP/1.1"  # keep-alive, so connections are pooled
+    # (connection, current run) pairs seen, one handler instance per connection
+    run = 0
+    seen = set()
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        FakeGroqHandler.seen.add((id(self), FakeGroqHandler.run))
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        completion = {"id": "x", "created": 0, "model": "fake"}
+        if body.get("stream"):
+            chunk = dict(completion, object="chat.completion.chunk", choices=[
+                {"index": 0, "delta": {"role": "assistant", "content": REPORT}, "finish_reason": None},
+            ])
+            end = dict(chunk, choices=[{"index": 0, "delta": {}, "finish_reason": "stop"}])
+            data = f"data: {json.dumps(chunk)}\n\ndata: {json.dumps(end)}\n\ndata: [DONE]\n\n"
+            content_type = "text/event-stream"
+        else:
+            data = json.dumps(dict(
+                completion,
+                object="chat.completion",
+                choices=[{"index": 0, "message": {"role": "assistant", "content": REPORT}, "finish_reason": "stop"}],
+                usage={"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+            ))
+            content_type = "application/json"
+        payload = data.encode()
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+@pytest.fixture
+def fake_groq(monkeypatch):
+    from analysts.llm import get_default_llm
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeGroqHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setenv("GROQ_API_KEY", "gsk_test")
+    monkeypatch.setenv("GROQ_API_BASE", f"http://127.0.0.1:{server.server_port}")
+    get_default_llm.cache_clear()
+    yield
+    get_default_llm.cache_clear()
+    server.shutdown()
+
+
+def test_analyze_many_twice_in_one_process(fake_groq):
+    from analysts import AnalystsTeam
+
+    team = AnalystsTeam()
+    FakeGroqHandler.seen.clear()
+    for run in range(2):
+        FakeGroqHandler.run = run
+        report = team.analyze_many([("TEST", MARKET_DATA)])[0]
+        reports = report["individual_reports"].values()
+        assert all(r["signal"] == "BUY" for r in reports), report
+
+    # No pooled connection was carried over from the first (closed) loop
+    connections = [connection for connection, _ in FakeGroqHandler.seen]
+    assert len(connections) == len(set(connections))
+
+
+def test_analyze_ticker_twice_in_one_process(fake_groq):
+    import main
+
+    main._get_analysts_team.cache_clear()
+    for _ in range(2):
+        result = main.analyze_ticker("TEST", output_format="json", quick_mode=True, market_data=MARKET_DATA)
+        reports = result["individual_reports"].values()
+        assert all(r["signal"] == "BUY" for r in reports), result